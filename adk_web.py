@@ -4,6 +4,7 @@ Launch the multi-agent system through a web interface with session management
 """
 import os
 import sys
+import time
 from pathlib import Path
 import threading
 
@@ -12,12 +13,12 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 # Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+from shared.env import load_env
+load_env()
 
 # Import enhanced components
 from workflows.enhanced_campaign_workflow import EnhancedCampaignWorkflow
-from shared.session_manager import SessionManager
+from shared.session_manager import get_session_manager
 from shared.realtime_streaming import LogStreamer, ProgressTracker
 from shared.logger import Logger
 
@@ -31,16 +32,31 @@ except ImportError:
     from flask import Flask, render_template, request, jsonify, Response, stream_with_context
     import json
 
+# Prefer orjson for request parsing when installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Largest accepted request body; bigger payloads are rejected before parsing
+MAX_REQUEST_BYTES = 1_000_000
+
 app = Flask(__name__)
+app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_BYTES
 logger = Logger("ADK_Web_Server")
 
 # Global session manager
-session_manager = SessionManager(storage_root="./storage")
+session_manager = get_session_manager("./storage")
 
 # Store active workflows by session ID
 active_workflows = {}
 workflow_lock = threading.Lock()
 
+# Upper bound and poll step when waiting for a new workflow's session ID
+SESSION_ID_TIMEOUT = 0.5
+SESSION_ID_POLL_INTERVAL = 0.01
+
 @app.route('/')
 def index():
     """Main dashboard page"""
@@ -58,10 +74,21 @@ def start_workflow():
     global active_workflows
     
     try:
-        data = request.json
+        if request.content_length and request.content_length > MAX_REQUEST_BYTES:
+            return jsonify({"error": "Request payload too large"}), 413
+        
+        try:
+            data = json_loads(request.get_data())
+        except ValueError:
+            return jsonify({"error": "Invalid JSON payload"}), 400
+        
+        # Reject malformed input before creating a workflow and session
+        if not isinstance(data, dict):
+            return jsonify({"error": "JSON object expected"}), 400
+        
         product_info = data.get('product_info', {})
         
-        if not product_info:
+        if not product_info or not isinstance(product_info, dict):
             return jsonify({"error": "Product information required"}), 400
         
         logger.info("Starting campaign workflow via web interface")
@@ -93,9 +120,10 @@ def start_workflow():
         thread = threading.Thread(target=run_workflow, daemon=True)
         thread.start()
         
-        # Wait a moment to get session ID
-        import time
-        time.sleep(0.5)
+        # Wait for the session ID, returning as soon as the workflow sets it
+        deadline = time.monotonic() + SESSION_ID_TIMEOUT
+        while not workflow.session_id and time.monotonic() < deadline:
+            time.sleep(SESSION_ID_POLL_INTERVAL)
         
         session_id = workflow.session_id if workflow.session_id else "pending"
         
@@ -234,54 +262,57 @@ def stream_session_logs(session_id):
         return jsonify({"error": str(e)}), 500
 
 
+# Static agent roster, serialized once at import instead of on every request
+AGENTS = [
+    {
+        "id": "lead_planner",
+        "name": "Lead Planner",
+        "type": "orchestrator",
+        "status": "active",
+        "description": "Strategic campaign architect"
+    },
+    {
+        "id": "market_research_analyst",
+        "name": "Market Research Analyst",
+        "type": "researcher",
+        "status": "active",
+        "description": "Competitive intelligence specialist"
+    },
+    {
+        "id": "seo_specialist",
+        "name": "SEO Specialist",
+        "type": "specialist",
+        "status": "active",
+        "description": "Keyword optimization expert"
+    },
+    {
+        "id": "copywriter",
+        "name": "Copywriter",
+        "type": "creator",
+        "status": "active",
+        "description": "Amazon listing content creator"
+    },
+    {
+        "id": "social_media_marketer",
+        "name": "Social Media Marketer",
+        "type": "marketer",
+        "status": "active",
+        "description": "Multi-platform campaign designer"
+    },
+    {
+        "id": "quality_validator",
+        "name": "Quality Validator",
+        "type": "validator",
+        "status": "active",
+        "description": "Compliance and quality assurance specialist"
+    }
+]
+AGENTS_JSON = (app.json.dumps(AGENTS, separators=(',', ':')) + '\n').encode('utf-8')
+
 @app.route('/api/agents')
 def get_agents():
     """Get list of available agents"""
-    agents = [
-        {
-            "id": "lead_planner",
-            "name": "Lead Planner",
-            "type": "orchestrator",
-            "status": "active",
-            "description": "Strategic campaign architect"
-        },
-        {
-            "id": "market_research_analyst",
-            "name": "Market Research Analyst",
-            "type": "researcher",
-            "status": "active",
-            "description": "Competitive intelligence specialist"
-        },
-        {
-            "id": "seo_specialist",
-            "name": "SEO Specialist",
-            "type": "specialist",
-            "status": "active",
-            "description": "Keyword optimization expert"
-        },
-        {
-            "id": "copywriter",
-            "name": "Copywriter",
-            "type": "creator",
-            "status": "active",
-            "description": "Amazon listing content creator"
-        },
-        {
-            "id": "social_media_marketer",
-            "name": "Social Media Marketer",
-            "type": "marketer",
-            "status": "active",
-            "description": "Multi-platform campaign designer"
-        },
-        {
-            "id": "quality_validator",
-            "name": "Quality Validator",
-            "type": "validator",
-            "status": "active",
-            "description": "Compliance and quality assurance specialist"
-        }
-    ]
-    return jsonify(agents)
+    return Response(AGENTS_JSON, mimetype=app.json.mimetype)
 
 @app.route('/api/cleanup', methods=['POST'])
 def cleanup_sessions():
@@ -335,5 +366,7 @@ if __name__ == '__main__':
     print("\n💡 Open your browser and navigate to http://localhost:8000")
     print("="*80 + "\n")
     
-    app.run(host='localhost', port=8000, debug=True, threaded=True)
+    # The reloader re-imports the app on every file change; opt in for development
+    debug = os.getenv("FLASK_DEBUG") == "1"
+    app.run(host='localhost', port=8000, debug=debug, threaded=True)
 
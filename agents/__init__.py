@@ -12,8 +12,15 @@ from .copywriter.agent import CopywriterAgent
 from .social_media_marketer.agent import SocialMediaMarketerAgent
 from .quality_validator.agent import QualityValidatorAgent
 
-# Import root agent for ADK web interface
-from .agent import root_agent
+
+# Root agent for ADK web interface, imported lazily
+def __getattr__(name):
+    """Load the ADK root agent on first access; it pulls in the ADK runtime."""
+    if name in ("root_agent", "app"):
+        from . import agent
+        return getattr(agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "LeadPlannerAgent",
@@ -23,4 +30,5 @@ __all__ = [
     "SocialMediaMarketerAgent",
     "QualityValidatorAgent",
     "root_agent",
+    "app",
 ]
@@ -4,13 +4,20 @@ Demonstrates advanced agentic behaviors through instruction.
 """
 
 from google.adk.agents import Agent
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.apps import App
 
 # === ROOT AGENT DEFINITION ===
 
+# Prompt-cache settings: the orchestrator instruction never changes between
+# turns, so it is billed once per TTL instead of on every request
+CACHE_TTL_SECONDS = 1800
+CACHE_INTERVALS = 10
+
 root_agent = Agent(
     name="campaign_orchestrator",
     model="gemini-2.0-flash-exp",
-    instruction="""You are an advanced AI Campaign Orchestrator for Amazon marketing with sophisticated capabilities:
+    static_instruction="""You are an advanced AI Campaign Orchestrator for Amazon marketing with sophisticated capabilities:
 
 **YOUR ROLE:**
 You coordinate a team of 6 specialized agents to create comprehensive Amazon marketing campaigns:
@@ -106,5 +113,15 @@ First, can you tell me more about your wireless earbuds? What makes them unique?
 """
 )
 
+# App wrapper enables Gemini context caching for the static instruction
+app = App(
+    name="agents",
+    root_agent=root_agent,
+    context_cache_config=ContextCacheConfig(
+        ttl_seconds=CACHE_TTL_SECONDS,
+        cache_intervals=CACHE_INTERVALS
+    )
+)
+
 # Export for ADK web interface
-__all__ = ['root_agent']
+__all__ = ['root_agent', 'app']
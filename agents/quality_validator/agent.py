@@ -5,7 +5,6 @@ This agent validates all content for compliance, accuracy, and quality before de
 """
 
 import os
-import yaml
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
@@ -13,10 +12,18 @@ from shared.memory_manager import MemoryManager
 from shared.logger import Logger
 from shared.context_manager import ContextManager
 from shared.hallucination_guard import HallucinationGuard
+from shared.resources import read_yaml, read_prompts
 from tools.compliance_checker import ComplianceChecker
 from tools.web_search_tool import WebSearchTool
 
 
+# Agent resource locations, resolved once at import
+_AGENT_DIR = Path(__file__).resolve().parent
+_CONFIG_PATH = _AGENT_DIR / "config.yaml"
+_TOOLS_MAP_PATH = _AGENT_DIR / "tools_map.yaml"
+_PROMPTS_DIR = _AGENT_DIR / "prompts"
+
+
 class QualityValidatorAgent:
     """
     Quality Validator Agent - Compliance and quality assurance specialist
@@ -63,33 +70,23 @@ class QualityValidatorAgent:
     def _load_config(self, config_path: Optional[str] = None) -> Dict[str, Any]:
         """Load agent configuration."""
         if config_path is None:
-            config_path = Path(__file__).parent / "config.yaml"
+            config_path = _CONFIG_PATH
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return read_yaml(str(config_path))
         except Exception:
             return {}
     
     def _load_prompts(self) -> Dict[str, str]:
         """Load prompt templates."""
-        prompts_dir = Path(__file__).parent / "prompts"
-        prompts = {}
-        
-        if prompts_dir.exists():
-            for prompt_file in prompts_dir.glob("*.txt"):
-                with open(prompt_file, 'r', encoding='utf-8') as f:
-                    prompts[prompt_file.stem] = f.read()
-        
-        return prompts
+        return read_prompts(str(_PROMPTS_DIR))
     
     def _load_tools_map(self) -> Dict[str, Any]:
         """Load tools mapping."""
-        tools_map_path = Path(__file__).parent / "tools_map.yaml"
+        tools_map_path = _TOOLS_MAP_PATH
         
         try:
-            with open(tools_map_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return read_yaml(str(tools_map_path))
         except Exception:
             return {}
     
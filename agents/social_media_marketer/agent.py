@@ -5,13 +5,38 @@ This agent creates comprehensive social media marketing campaigns across multipl
 """
 
 import os
-import yaml
+import sys
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
 from shared.memory_manager import MemoryManager
 from shared.logger import Logger
 from shared.context_manager import ContextManager
+from shared.resources import read_yaml, read_prompts
+
+
+# Agent resource locations, resolved once at import
+_AGENT_DIR = Path(__file__).resolve().parent
+_CONFIG_PATH = _AGENT_DIR / "config.yaml"
+_TOOLS_MAP_PATH = _AGENT_DIR / "tools_map.yaml"
+_PROMPTS_DIR = _AGENT_DIR / "prompts"
+
+
+# Campaign keys looked up by the quality validator and output generator
+FACEBOOK_CAMPAIGN = sys.intern("facebook_campaign")
+INSTAGRAM_CAMPAIGN = sys.intern("instagram_campaign")
+TIKTOK_CAMPAIGN = sys.intern("tiktok_campaign")
+PINTEREST_CAMPAIGN = sys.intern("pinterest_campaign")
+
+_PLATFORMS = ("Facebook", "Instagram", "TikTok", "Pinterest")
+
+# Static hashtag sets; each campaign build gets its own list copy
+_IG_SHOWCASE_HASHTAGS = ("#amazonfinds", "#musthave", "#shopping", "#productreview")
+_IG_UGC_HASHTAGS = ("#customerreview", "#happycustomer", "#testimonial")
+_IG_TIPS_HASHTAGS = ("#protip", "#howtouse", "#tutorial")
+_TIKTOK_FIND_HASHTAGS = ("#amazonfind", "#amazonmusthaves", "#tiktokmademebuyit")
+_TIKTOK_SOLUTION_HASHTAGS = ("#problemsolved", "#lifehack", "#amazonfinds")
+_TIKTOK_REVIEW_HASHTAGS = ("#customerreview", "#5stars", "#grateful")
 
 
 class SocialMediaMarketerAgent:
@@ -26,6 +51,19 @@ class SocialMediaMarketerAgent:
     - Coordinate cross-platform campaigns
     """
     
+    __slots__ = (
+        "agent_id",
+        "config",
+        "memory",
+        "context",
+        "logger",
+        "prompts",
+        "tools_map",
+        "role",
+        "goal",
+        "backstory"
+    )
+    
     def __init__(
         self,
         agent_id: str = "social_media_marketer",
@@ -55,33 +93,23 @@ class SocialMediaMarketerAgent:
     def _load_config(self, config_path: Optional[str] = None) -> Dict[str, Any]:
         """Load agent configuration."""
         if config_path is None:
-            config_path = Path(__file__).parent / "config.yaml"
+            config_path = _CONFIG_PATH
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return read_yaml(str(config_path))
         except Exception:
             return {}
     
     def _load_prompts(self) -> Dict[str, str]:
         """Load prompt templates."""
-        prompts_dir = Path(__file__).parent / "prompts"
-        prompts = {}
-        
-        if prompts_dir.exists():
-            for prompt_file in prompts_dir.glob("*.txt"):
-                with open(prompt_file, 'r', encoding='utf-8') as f:
-                    prompts[prompt_file.stem] = f.read()
-        
-        return prompts
+        return read_prompts(str(_PROMPTS_DIR))
     
     def _load_tools_map(self) -> Dict[str, Any]:
         """Load tools mapping."""
-        tools_map_path = Path(__file__).parent / "tools_map.yaml"
+        tools_map_path = _TOOLS_MAP_PATH
         
         try:
-            with open(tools_map_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return read_yaml(str(tools_map_path))
         except Exception:
             return {}
     
@@ -97,25 +125,19 @@ class SocialMediaMarketerAgent:
         """
         self.logger.info("Creating social media campaigns", agent_id=self.agent_id)
         
-        # Retrieve listing content
-        listing = self.memory.retrieve(
-            agent_id="copywriter",
-            key="amazon_listing",
-            memory_type="long_term"
-        ) or {}
+        # Retrieve listing content and market insights in a single batch
+        listing_request = ("copywriter", "amazon_listing", "long_term")
+        insights_request = ("market_research_analyst", "market_analysis", "long_term")
+        results = self.memory.retrieve_many([listing_request, insights_request])
         
-        # Retrieve market insights
-        market_insights = self.memory.retrieve(
-            agent_id="market_research_analyst",
-            key="market_analysis",
-            memory_type="long_term"
-        ) or {}
+        listing = results[listing_request] or {}
+        market_insights = results[insights_request] or {}
         
         campaigns = {
-            "facebook_campaign": self.create_facebook_campaign(product_info, listing),
-            "instagram_campaign": self.create_instagram_campaign(product_info, listing),
-            "tiktok_campaign": self.create_tiktok_campaign(product_info, listing),
-            "pinterest_campaign": self.create_pinterest_campaign(product_info, listing),
+            FACEBOOK_CAMPAIGN: self.create_facebook_campaign(product_info, listing),
+            INSTAGRAM_CAMPAIGN: self.create_instagram_campaign(product_info, listing),
+            TIKTOK_CAMPAIGN: self.create_tiktok_campaign(product_info, listing),
+            PINTEREST_CAMPAIGN: self.create_pinterest_campaign(product_info, listing),
             "content_calendar": self._create_content_calendar(),
             "budget_allocation": self._calculate_budget_allocation(),
             "kpis": self._define_kpis(),
@@ -147,13 +169,15 @@ class SocialMediaMarketerAgent:
         listing: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Create Facebook advertising campaign."""
-        product_name = product_info.get("name", "Our Product")
+        product_name = product_info.get("name") or "Our Product"
+        category = product_info.get("category") or "general"
+        headline = f"Discover {product_name} - Top Rated on Amazon"
         
         return {
             "campaign_objective": "Conversions",
             "target_audience": {
                 "age_range": "25-54",
-                "interests": ["shopping", "amazon", product_info.get("category", "general")],
+                "interests": ["shopping", "amazon", category],
                 "behaviors": ["online shoppers", "engaged shoppers"],
                 "demographics": "All genders, middle to upper income"
             },
@@ -180,7 +204,7 @@ class SocialMediaMarketerAgent:
             "ad_creatives": [
                 {
                     "format": "Carousel",
-                    "headline": f"Discover {product_name} - Top Rated on Amazon",
+                    "headline": headline,
                     "primary_text": "Transform your life with our premium product. Limited time offer!",
                     "cta": "Shop Now",
                     "images": "Product + lifestyle shots"
@@ -228,19 +252,19 @@ class SocialMediaMarketerAgent:
                 {
                     "type": "Product Showcase",
                     "caption": "✨ Introducing our game-changer! Swipe to see all the amazing features. Link in bio! #amazon #newproduct",
-                    "hashtags": ["#amazonfinds", "#musthave", "#shopping", "#productreview"],
+                    "hashtags": list(_IG_SHOWCASE_HASHTAGS),
                     "frequency": "3x per week"
                 },
                 {
                     "type": "User Generated Content",
                     "caption": "💙 Our customers love us! Thanks @customer for sharing. Tag us for a chance to be featured!",
-                    "hashtags": ["#customerreview", "#happycustomer", "#testimonial"],
+                    "hashtags": list(_IG_UGC_HASHTAGS),
                     "frequency": "2x per week"
                 },
                 {
                     "type": "Educational Tips",
                     "caption": "📚 Pro tip: Here's how to get the most out of your product. Save this for later!",
-                    "hashtags": ["#protip", "#howtouse", "#tutorial"],
+                    "hashtags": list(_IG_TIPS_HASHTAGS),
                     "frequency": "2x per week"
                 }
             ],
@@ -309,7 +333,7 @@ class SocialMediaMarketerAgent:
                     "content": "Quick product demo showing key features",
                     "cta": "Link in bio to shop!",
                     "trending_sound": "Use current viral audio",
-                    "hashtags": ["#amazonfind", "#amazonmusthaves", "#tiktokmademebuyit"]
+                    "hashtags": list(_TIKTOK_FIND_HASHTAGS)
                 },
                 {
                     "title": "Problem → Solution",
@@ -317,7 +341,7 @@ class SocialMediaMarketerAgent:
                     "content": "Show problem then product solving it",
                     "cta": "Get yours now!",
                     "trending_sound": "Transformation audio",
-                    "hashtags": ["#problemsolved", "#lifehack", "#amazonfinds"]
+                    "hashtags": list(_TIKTOK_SOLUTION_HASHTAGS)
                 },
                 {
                     "title": "5-Star Review Reaction",
@@ -325,7 +349,7 @@ class SocialMediaMarketerAgent:
                     "content": "React to real customer reviews",
                     "cta": "Thank you for the love!",
                     "trending_sound": "Emotional music",
-                    "hashtags": ["#customerreview", "#5stars", "#grateful"]
+                    "hashtags": list(_TIKTOK_REVIEW_HASHTAGS)
                 }
             ],
             "posting_strategy": {
@@ -492,6 +516,6 @@ class SocialMediaMarketerAgent:
             "agent_id": self.agent_id,
             "role": self.role,
             "status": "active",
-            "platforms": ["Facebook", "Instagram", "TikTok", "Pinterest"],
+            "platforms": list(_PLATFORMS),
             "memory_keys": list(self.memory.retrieve(self.agent_id, "all", "short_term").keys())
         }
@@ -3,16 +3,17 @@ Demonstration of Advanced Agentic Behaviors
 Tests: Memory, Tool Use, Hallucination Prevention, Monitoring & Logging
 """
 
+import concurrent.futures
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-# Add project root to path
+# Add project root to path (already there when run as a script)
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from rich.console import Console, Group
 from agents.agent import (
     remember_info, 
     recall_info, 
@@ -24,95 +25,115 @@ from agents.agent import (
 )
 
 console = Console()
+HEADER_RULE = f"[bold cyan]{'='*70}[/bold cyan]"
+
+def format_header(title: str) -> str:
+    """Build the markup for a section header."""
+    return f"\n{HEADER_RULE}\n[bold white]{title:^70}[/bold white]\n{HEADER_RULE}\n"
 
 def print_header(title: str):
     """Print a formatted header."""
-    console.print(f"\n[bold cyan]{'='*70}[/bold cyan]")
-    console.print(f"[bold white]{title:^70}[/bold white]")
-    console.print(f"[bold cyan]{'='*70}[/bold cyan]\n")
+    console.print(format_header(title))
 
 def demo_memory():
     """Demonstrate memory management capabilities."""
-    print_header("1. MEMORY MANAGEMENT")
+    # Collect the section so it can be rendered in one write
+    items = [format_header("1. MEMORY MANAGEMENT")]
     
-    console.print("[yellow]→ Storing product information...[/yellow]")
+    items.append("[yellow]→ Storing product information...[/yellow]")
     result1 = remember_info("product_name", "Premium Wireless Earbuds")
-    console.print(f"  [green]{result1}[/green]")
+    items.append(f"  [green]{result1}[/green]")
     
     result2 = remember_info("category", "Electronics")
-    console.print(f"  [green]{result2}[/green]")
+    items.append(f"  [green]{result2}[/green]")
     
     result3 = remember_info("target_audience", "Young professionals, fitness enthusiasts")
-    console.print(f"  [green]{result3}[/green]")
+    items.append(f"  [green]{result3}[/green]")
     
-    console.print("\n[yellow]→ Retrieving stored information...[/yellow]")
+    items.append("\n[yellow]→ Retrieving stored information...[/yellow]")
     recalled1 = recall_info("product_name")
-    console.print(f"  [blue]Product: {recalled1}[/blue]")
+    items.append(f"  [blue]Product: {recalled1}[/blue]")
     
     recalled2 = recall_info("category")
-    console.print(f"  [blue]Category: {recalled2}[/blue]")
+    items.append(f"  [blue]Category: {recalled2}[/blue]")
     
     recalled3 = recall_info("target_audience")
-    console.print(f"  [blue]Audience: {recalled3}[/blue]")
+    items.append(f"  [blue]Audience: {recalled3}[/blue]")
     
-    console.print("\n[green]✓ Memory Management: PASSED[/green]")
+    items.append("\n[green]✓ Memory Management: PASSED[/green]")
+    return Group(*items)
 
 def demo_tools():
     """Demonstrate tool use capabilities."""
-    print_header("2. TOOL USE & ORCHESTRATION")
+    from rich.panel import Panel
+    
+    # Collect the section so it can be rendered in one write
+    items = [format_header("2. TOOL USE & ORCHESTRATION")]
     
-    console.print("[yellow]→ Searching market trends...[/yellow]")
+    items.append("[yellow]→ Searching market trends...[/yellow]")
     search_results = search_market("wireless earbuds market trends 2024", 3)
-    console.print(Panel(search_results, title="Market Search Results", border_style="blue"))
+    items.append(Panel(search_results, title="Market Search Results", border_style="blue"))
     
-    console.print("\n[yellow]→ Researching SEO keywords...[/yellow]")
+    items.append("\n[yellow]→ Researching SEO keywords...[/yellow]")
     keywords = find_keywords("wireless earbuds", "Electronics")
-    console.print(Panel(keywords, title="Keyword Research Results", border_style="blue"))
+    items.append(Panel(keywords, title="Keyword Research Results", border_style="blue"))
     
-    console.print("\n[green]✓ Tool Use: PASSED[/green]")
+    items.append("\n[green]✓ Tool Use: PASSED[/green]")
+    return Group(*items)
 
 def demo_hallucination_prevention():
     """Demonstrate hallucination detection and prevention."""
-    print_header("3. HALLUCINATION PREVENTION")
+    from rich.panel import Panel
+    
+    # Collect the section so it can be rendered in one write
+    items = [format_header("3. HALLUCINATION PREVENTION")]
     
     # Test 1: Valid claim
-    console.print("[yellow]→ Testing VALID claim validation...[/yellow]")
+    items.append("[yellow]→ Testing VALID claim validation...[/yellow]")
     claim1 = "This product has excellent customer reviews"
     context1 = "Customer reviews show 4.5/5 stars with 85% positive feedback and 1,200+ verified purchases"
     
     result1 = verify_claim(claim1, context1)
-    console.print(Panel(result1, title=f"Claim: '{claim1}'", border_style="green"))
+    items.append(Panel(result1, title=f"Claim: '{claim1}'", border_style="green"))
     
     # Test 2: Invalid claim
-    console.print("\n[yellow]→ Testing INVALID claim validation...[/yellow]")
+    items.append("\n[yellow]→ Testing INVALID claim validation...[/yellow]")
     claim2 = "This product is the #1 best seller worldwide"
     context2 = "This is a new wireless earbud product launched 3 months ago"
     
     result2 = verify_claim(claim2, context2)
-    console.print(Panel(result2, title=f"Claim: '{claim2}'", border_style="red"))
+    items.append(Panel(result2, title=f"Claim: '{claim2}'", border_style="red"))
     
     # Test 3: Partially supported claim
-    console.print("\n[yellow]→ Testing PARTIALLY supported claim...[/yellow]")
+    items.append("\n[yellow]→ Testing PARTIALLY supported claim...[/yellow]")
     claim3 = "This product offers 24-hour battery life"
     context3 = "Product specifications list 20 hours of playback time with charging case"
     
     result3 = verify_claim(claim3, context3)
-    console.print(Panel(result3, title=f"Claim: '{claim3}'", border_style="yellow"))
+    items.append(Panel(result3, title=f"Claim: '{claim3}'", border_style="yellow"))
     
-    console.print("\n[green]✓ Hallucination Prevention: PASSED[/green]")
+    items.append("\n[green]✓ Hallucination Prevention: PASSED[/green]")
+    return Group(*items)
 
 def demo_monitoring():
     """Demonstrate monitoring and logging capabilities."""
-    print_header("4. MONITORING & LOGGING")
+    from rich.panel import Panel
     
-    console.print("[yellow]→ Retrieving performance metrics...[/yellow]")
+    # Collect the section so it can be rendered in one write
+    items = [format_header("4. MONITORING & LOGGING")]
+    
+    items.append("[yellow]→ Retrieving performance metrics...[/yellow]")
     metrics = check_performance()
-    console.print(Panel(metrics, title="Agent Performance Metrics", border_style="cyan"))
+    items.append(Panel(metrics, title="Agent Performance Metrics", border_style="cyan"))
     
-    console.print("\n[green]✓ Monitoring: PASSED[/green]")
+    items.append("\n[green]✓ Monitoring: PASSED[/green]")
+    return Group(*items)
 
+@lru_cache(maxsize=None)
 def create_summary_table():
-    """Create a summary table of all features."""
+    """Create a summary table of all features (built once, it never changes)."""
+    from rich.table import Table
+    
     table = Table(title="Advanced Agentic Behaviors Summary", show_header=True, header_style="bold magenta")
     
     table.add_column("Feature", style="cyan", width=25)
@@ -158,11 +179,16 @@ def main():
         return
     
     try:
-        # Run all demonstrations
-        demo_memory()
-        demo_tools()
-        demo_hallucination_prevention()
-        demo_monitoring()
+        # Run all demonstrations; only the memory demo writes shared state,
+        # so the remaining sections run concurrently and print in order
+        console.print(demo_memory())
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            sections = [
+                executor.submit(demo)
+                for demo in (demo_tools, demo_hallucination_prevention, demo_monitoring)
+            ]
+            for section in sections:
+                console.print(section.result())
         
         # Show summary
         print_header("SUMMARY")
@@ -6,33 +6,103 @@ Orchestrates the complete workflow using Google ADK.
 import os
 import sys
 import json
+import pickle
+import time
+import traceback
 import yaml
+import importlib
+import threading
+import concurrent.futures
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
-from dotenv import load_dotenv
+from typing import Dict, Any, List
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-# Load environment variables
-load_dotenv()
+# Prefer orjson for writing campaign results when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Import shared utilities
-from shared.memory_manager import MemoryManager
-from shared.context_manager import ContextManager
-from shared.logger import setup_logger, get_logger, log_workflow_start, log_workflow_complete
-from shared.monitor import WorkflowMonitor
-from shared.state_tracker import StateTracker
-from shared.hallucination_guard import HallucinationGuard
+# Project root, used for the import path, configs and result files
+PROJECT_ROOT = Path(__file__).parent
+
+# Add project root to path
+sys.path.insert(0, str(PROJECT_ROOT))
 
-# Import tools
-from tools.web_search_tool import WebSearchTool
-from tools.keyword_research_tool import KeywordResearchTool
-from tools.amazon_listing_parser import AmazonListingParser
-from tools.compliance_checker import ComplianceChecker
-from tools.calculator_tool import CalculatorTool
-from tools.file_parser_tool import FileParserTool
+# Load environment variables
+from shared.env import load_env
+load_env()
+
+# Tools by name -> (module, class); imported and built on first use
+_TOOL_REGISTRY = {
+    "web_search": ("tools.web_search_tool", "WebSearchTool"),
+    "keyword_research": ("tools.keyword_research_tool", "KeywordResearchTool"),
+    "listing_parser": ("tools.amazon_listing_parser", "AmazonListingParser"),
+    "compliance_checker": ("tools.compliance_checker", "ComplianceChecker"),
+    "calculator": ("tools.calculator_tool", "CalculatorTool"),
+    "file_parser": ("tools.file_parser_tool", "FileParserTool"),
+}
+
+# Console banners for main(), built once at import
+_START_BANNER = "\n".join([
+    "=" * 80,
+    "🚀 Amazon Campaign Multi-Agent System (Google ADK)",
+    "=" * 80,
+    ""
+])
+_API_KEY_HINT = "\n".join([
+    "⚠️  Warning: GEMINI_API_KEY not set in .env file",
+    "The system will run in demo mode with simulated agent outputs.",
+    ""
+])
+_SUCCESS_BANNER = "\n".join([
+    "",
+    "=" * 80,
+    "✅ Campaign Generation Complete!",
+    "=" * 80
+])
+
+# Campaign results are written here so run_campaign can return without waiting
+_PERSIST_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="campaign-persist"
+)
+
+
+class _LazyToolRegistry(Mapping):
+    """Read-only tool mapping that imports and constructs each tool on first access."""
+    
+    __slots__ = ("_registry", "_instances", "_lock")
+    
+    def __init__(self, registry: Dict[str, tuple]):
+        self._registry = registry
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        
+    def __getitem__(self, name: str) -> Any:
+        tool = self._instances.get(name)
+        if tool is not None:
+            return tool
+        module_name, class_name = self._registry[name]
+        # Stages run on worker threads, so build each tool only once
+        with self._lock:
+            if name not in self._instances:
+                module = importlib.import_module(module_name)
+                self._instances[name] = getattr(module, class_name)()
+            return self._instances[name]
+            
+    def __iter__(self):
+        return iter(self._registry)
+        
+    def __len__(self) -> int:
+        return len(self._registry)
 
 
 class AmazonCampaignSystem:
@@ -40,8 +110,19 @@ class AmazonCampaignSystem:
     Main orchestrator for the Amazon Campaign Multi-Agent System.
     """
     
+    __slots__ = (
+        "logger", "config", "memory_manager", "context_manager",
+        "hallucination_guard", "tools", "_pending_saves"
+    )
+    
     def __init__(self):
         """Initialize the campaign system."""
+        # Shared utilities are imported here so importing main stays cheap
+        from shared.memory_manager import MemoryManager
+        from shared.context_manager import ContextManager
+        from shared.logger import setup_logger, get_logger
+        from shared.hallucination_guard import HallucinationGuard
+        
         # Setup logger
         setup_logger()
         self.logger = get_logger("AmazonCampaignSystem")
@@ -55,20 +136,16 @@ class AmazonCampaignSystem:
         self.hallucination_guard = HallucinationGuard()
         
         # Initialize tools
-        self.tools = {
-            "web_search": WebSearchTool(),
-            "keyword_research": KeywordResearchTool(),
-            "listing_parser": AmazonListingParser(),
-            "compliance_checker": ComplianceChecker(),
-            "calculator": CalculatorTool(),
-            "file_parser": FileParserTool()
-        }
+        self.tools = _LazyToolRegistry(_TOOL_REGISTRY)
+        
+        # Output saves still running on the persistence thread
+        self._pending_saves: List[concurrent.futures.Future] = []
         
         self.logger.info("✅ Amazon Campaign System initialized successfully")
         
     def _load_config(self) -> Dict:
         """Load system configuration."""
-        config_dir = Path(__file__).parent / "config"
+        config_dir = PROJECT_ROOT / "config"
         
         configs = {}
         config_files = ["global_config.yaml", "workflow_config.yaml", "agent_registry.yaml"]
@@ -76,12 +153,49 @@ class AmazonCampaignSystem:
         for config_file in config_files:
             config_path = config_dir / config_file
             if config_path.exists():
-                with open(config_path, 'r') as f:
-                    key = config_file.replace("_config.yaml", "").replace(".yaml", "")
-                    configs[key] = yaml.safe_load(f)
+                key = config_file.replace("_config.yaml", "").replace(".yaml", "")
+                configs[key] = self._load_yaml_cached(config_path)
                     
         return configs
         
+    def _load_yaml_cached(self, config_path: Path) -> Any:
+        """
+        Load a YAML file through a pickled copy that is keyed on its mtime.
+        
+        Args:
+            config_path: Path to the YAML file
+            
+        Returns:
+            Parsed YAML content
+        """
+        cache_path = config_path.parent / ".cache" / f"{config_path.name}.pkl"
+        mtime = os.path.getmtime(config_path)
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_mtime, data = pickle.load(f)
+            if cached_mtime == mtime:
+                return data
+        except Exception:
+            pass  # Missing or stale cache, parse the YAML below
+            
+        with open(config_path, 'r') as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+            
+        # Write to a per-process temp file and swap it in, so a concurrent
+        # reader never sees a partially written cache
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((mtime, data), f, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            self.logger.warning(f"Could not cache config {config_path.name}: {e}")
+            
+        return data
+        
     def run_campaign(self, product_input: Dict[str, Any]) -> Dict[str, Any]:
         """
         Run complete campaign workflow.
@@ -92,7 +206,11 @@ class AmazonCampaignSystem:
         Returns:
             Complete campaign output
         """
-        workflow_id = f"campaign_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        from shared.logger import log_workflow_start, log_workflow_complete
+        from shared.monitor import WorkflowMonitor
+        from shared.state_tracker import StateTracker
+        
+        workflow_id = f"campaign_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
         self.logger.info(f"🚀 Starting workflow: {workflow_id}")
         log_workflow_start("Amazon Campaign Workflow", workflow_id)
         
@@ -111,44 +229,58 @@ class AmazonCampaignSystem:
             self.logger.info("📋 Stage 1: Strategic Planning")
             monitor.start_stage("stage_1", "Strategic Planning")
             planning_result = self._run_lead_planner(product_input, context)
-            self.context_manager.store_agent_output("lead_planner", "Lead Planner", planning_result)
             monitor.end_stage("stage_1")
             
             # Stage 2: Parallel Market Intelligence
             self.logger.info("🔍 Stage 2: Market Intelligence (Parallel Execution)")
             monitor.start_stage("stage_2", "Market Intelligence")
             
-            # Run market research and SEO in parallel (simulated)
-            market_research = self._run_market_research(product_input, context)
-            seo_analysis = self._run_seo_specialist(product_input, context)
+            # Run market research and SEO in parallel
+            parallel_start = time.time()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                market_future = executor.submit(self._run_market_research, product_input, context)
+                seo_future = executor.submit(self._run_seo_specialist, product_input, context)
+                market_research = market_future.result()
+                seo_analysis = seo_future.result()
+            parallel_duration = time.time() - parallel_start
             
-            self.context_manager.store_agent_output("market_research", "Market Research Analyst", market_research)
-            self.context_manager.store_agent_output("seo_specialist", "SEO Specialist", seo_analysis)
+            # Publish both results from this thread in one batch
+            self.memory_manager.store_many([
+                ("market_research", "insights", market_research, "shared"),
+                ("seo_specialist", "strategy", seo_analysis, "shared")
+            ])
             
-            monitor.log_parallel_execution(["market_research", "seo_specialist"], 15.0)
+            monitor.log_parallel_execution(["market_research", "seo_specialist"], parallel_duration)
             monitor.end_stage("stage_2")
             
             # Stage 3: Content Creation
             self.logger.info("✍️ Stage 3: Content Creation")
             monitor.start_stage("stage_3", "Content Creation")
             listing_content = self._run_copywriter(product_input, context, market_research, seo_analysis)
-            self.context_manager.store_agent_output("copywriter", "Copywriter", listing_content)
             monitor.end_stage("stage_3")
             
             # Stage 4: Social Media Campaign
             self.logger.info("📱 Stage 4: Social Media Campaign")
             monitor.start_stage("stage_4", "Social Media Campaign")
             social_campaign = self._run_social_media_marketer(product_input, context, listing_content, market_research)
-            self.context_manager.store_agent_output("social_marketer", "Social Media Marketer", social_campaign)
             monitor.end_stage("stage_4")
             
             # Stage 5: Quality Validation
             self.logger.info("✅ Stage 5: Quality Validation")
             monitor.start_stage("stage_5", "Quality Validation")
             validation_result = self._run_quality_validator(listing_content, social_campaign, context)
-            self.context_manager.store_agent_output("validator", "Quality Validator", validation_result)
             monitor.end_stage("stage_5")
             
+            # No stage reads another's output through the context, so record them all at once
+            self.context_manager.store_agent_outputs([
+                ("lead_planner", "Lead Planner", planning_result),
+                ("market_research", "Market Research Analyst", market_research),
+                ("seo_specialist", "SEO Specialist", seo_analysis),
+                ("copywriter", "Copywriter", listing_content),
+                ("social_marketer", "Social Media Marketer", social_campaign),
+                ("validator", "Quality Validator", validation_result)
+            ])
+            
             # Compile final results
             final_output = {
                 "workflow_id": workflow_id,
@@ -162,8 +294,10 @@ class AmazonCampaignSystem:
                 "workflow_metrics": monitor.get_metrics_summary()
             }
             
-            # Save outputs
-            self._save_outputs(workflow_id, final_output)
+            # Save outputs in the background; wait_for_saves() joins them
+            save_future = _PERSIST_EXECUTOR.submit(self._save_outputs, workflow_id, final_output)
+            save_future.add_done_callback(self._log_save_error)
+            self._pending_saves.append(save_future)
             
             monitor.end()
             execution_time = monitor.get_total_execution_time()
@@ -177,6 +311,36 @@ class AmazonCampaignSystem:
             self.logger.error(f"❌ Workflow failed: {str(e)}")
             raise
             
+    def run_campaigns(self, product_inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run the campaign workflow for several products with one system instance.
+        
+        Configuration, tools and memory are initialized once and reused for
+        every product instead of building a new system per campaign.
+        
+        Args:
+            product_inputs: List of product and campaign information dicts
+            
+        Returns:
+            Campaign outputs in the same order as the inputs, saved to disk
+        """
+        self.logger.info(f"📦 Running batch of {len(product_inputs)} campaigns")
+        results = [self.run_campaign(product_input) for product_input in product_inputs]
+        self.wait_for_saves()
+        return results
+        
+    def wait_for_saves(self):
+        """Block until every queued campaign output has been written to disk."""
+        pending, self._pending_saves = self._pending_saves, []
+        for future in pending:
+            future.result()
+            
+    def _log_save_error(self, future: concurrent.futures.Future):
+        """Report a failed background save as soon as it finishes."""
+        error = future.exception()
+        if error is not None:
+            self.logger.error(f"❌ Failed to save campaign outputs: {error}")
+            
     def _run_lead_planner(self, product_input: Dict, context: Dict) -> Dict[str, Any]:
         """Execute Lead Planner agent."""
         self.logger.info("🤖 Executing: Lead Planner")
@@ -267,8 +431,6 @@ class AmazonCampaignSystem:
             "web_sources": [r.get("url", "") for r in trend_results[:3]]
         }
         
-        self.memory_manager.store("market_research", "insights", insights, "shared")
-        
         return insights
         
     def _run_seo_specialist(self, product_input: Dict, context: Dict) -> Dict[str, Any]:
@@ -282,11 +444,22 @@ class AmazonCampaignSystem:
         # Use keyword research tool
         keyword_tool = self.tools["keyword_research"]
         
-        # Generate keywords
-        all_keywords = keyword_tool.generate_keywords(product_name, category)
-        primary_keywords = keyword_tool.get_primary_keywords(product_name, category, 5)
-        secondary_keywords = keyword_tool.get_secondary_keywords(product_name, category, 10)
-        long_tail_keywords = keyword_tool.get_long_tail_keywords(product_name, category, 4)
+        # Generate and group keywords in one pass
+        keyword_groups = keyword_tool.get_keyword_groups(product_name, category, 5, 10, 4)
+        all_keywords = keyword_groups["all"]
+        primary_keywords = keyword_groups["primary"]
+        secondary_keywords = keyword_groups["secondary"]
+        long_tail_keywords = keyword_groups["long_tail"]
+        
+        # Bin keywords by competition level in a single pass
+        competition_buckets = {"high": [], "medium": [], "low": []}
+        for keyword in all_keywords:
+            bucket = competition_buckets.get(keyword.get("competition"))
+            if bucket is not None:
+                bucket.append(keyword)
+        
+        top_keywords = all_keywords[:10]
+        total_monthly_searches = sum(k.get("search_volume", 0) for k in top_keywords)
         
         strategy = {
             "primary_keywords": primary_keywords[:5],
@@ -299,13 +472,13 @@ class AmazonCampaignSystem:
                 "backend_keywords": secondary_keywords[5:] + long_tail_keywords
             },
             "competition_analysis": {
-                "high_competition": [k for k in all_keywords if k.get("competition") == "high"][:3],
-                "medium_competition": [k for k in all_keywords if k.get("competition") == "medium"][:5],
-                "low_competition": [k for k in all_keywords if k.get("competition") == "low"][:5]
+                "high_competition": competition_buckets["high"][:3],
+                "medium_competition": competition_buckets["medium"][:5],
+                "low_competition": competition_buckets["low"][:5]
             },
             "search_volume_estimates": {
-                "total_monthly_searches": sum(k.get("search_volume", 0) for k in all_keywords[:10]),
-                "avg_search_volume": sum(k.get("search_volume", 0) for k in all_keywords[:10]) // 10 if all_keywords else 0
+                "total_monthly_searches": total_monthly_searches,
+                "avg_search_volume": total_monthly_searches // len(top_keywords) if top_keywords else 0
             },
             "recommendations": [
                 "Focus on long-tail keywords for quick wins",
@@ -315,8 +488,6 @@ class AmazonCampaignSystem:
             ]
         }
         
-        self.memory_manager.store("seo_specialist", "strategy", strategy, "shared")
-        
         return strategy
         
     def _run_copywriter(self, product_input: Dict, context: Dict, 
@@ -333,13 +504,22 @@ class AmazonCampaignSystem:
         primary_kw = seo_strategy.get("primary_keywords", [product_name])
         title_kw = seo_strategy.get("keyword_strategy", {}).get("title_keywords", primary_kw[:2])
         
+        # Resolve feature/USP fallbacks once, before building the listing text
+        title_keyword = title_kw[0] if title_kw else ''
+        quality_point = features[0] if features else 'High-quality construction for lasting durability'
+        benefit_point = usps[0] if usps else 'Designed to exceed your expectations'
+        versatility_point = features[1] if len(features) > 1 else 'Perfect for multiple applications'
+        featured_detail = features[0] if features else 'premium materials and expert craftsmanship'
+        primary_reason = usps[0] if usps else 'Superior quality that stands the test of time'
+        secondary_reason = usps[1] if len(usps) > 1 else 'Exceptional value for your investment'
+        
         # Generate optimized listing
         listing = {
-            "product_title": f"{product_name} - {title_kw[0] if title_kw else ''} | Premium Quality {product_info.get('product_category', '')}",
+            "product_title": f"{product_name} - {title_keyword} | Premium Quality {product_info.get('product_category', '')}",
             "bullet_points": [
-                f"✓ PREMIUM QUALITY: {features[0] if features else 'High-quality construction for lasting durability'}",
-                f"✓ KEY BENEFIT: {usps[0] if usps else 'Designed to exceed your expectations'}",
-                f"✓ VERSATILE USE: {features[1] if len(features) > 1 else 'Perfect for multiple applications'}",
+                f"✓ PREMIUM QUALITY: {quality_point}",
+                f"✓ KEY BENEFIT: {benefit_point}",
+                f"✓ VERSATILE USE: {versatility_point}",
                 f"✓ CUSTOMER SATISFACTION: Backed by our 100% satisfaction guarantee",
                 f"✓ TRUSTED BRAND: Join thousands of satisfied customers who love our products"
             ],
@@ -347,11 +527,11 @@ class AmazonCampaignSystem:
 <b>Transform Your Experience with {product_name}</b>
 
 Discover the perfect blend of quality, functionality, and value. Our {product_name} is designed 
-with you in mind, featuring {features[0] if features else 'premium materials and expert craftsmanship'}.
+with you in mind, featuring {featured_detail}.
 
 <b>Why Choose Our {product_name}?</b>
-• {usps[0] if usps else 'Superior quality that stands the test of time'}
-• {usps[1] if len(usps) > 1 else 'Exceptional value for your investment'}
+• {primary_reason}
+• {secondary_reason}
 • Backed by our satisfaction guarantee
 
 <b>Perfect For:</b>
@@ -390,6 +570,8 @@ Order now and experience the difference!
         
         product_info = product_input.get("product_info", {})
         product_name = product_info.get("product_name", "")
+        featured_benefit = product_info.get('product_features', ['amazing benefits'])[0]
+        lead_bullet = listing.get('bullet_points', [''])[0]
         
         campaign = {
             "platforms": {
@@ -404,7 +586,7 @@ Order now and experience the difference!
                     },
                     "sample_posts": [
                         f"🌟 Introducing {product_name}! Transform your daily routine with premium quality.",
-                        f"💡 Did you know? {product_name} features {product_info.get('product_features', ['amazing benefits'])[0]}",
+                        f"💡 Did you know? {product_name} features {featured_benefit}",
                         f"🎉 Limited time offer! Get your {product_name} today. Link in bio!"
                     ]
                 },
@@ -414,7 +596,7 @@ Order now and experience the difference!
                     "hashtags": [f"#{product_name.replace(' ', '')}", f"#{product_info.get('product_category', 'product')}",
                                "#AmazonFinds", "#ProductReview", "#ShopSmall"],
                     "sample_captions": [
-                        f"✨ Meet your new favorite: {product_name} ✨\n\n{listing.get('bullet_points', [''])[0]}\n\nShop now! Link in bio 🛒",
+                        f"✨ Meet your new favorite: {product_name} ✨\n\n{lead_bullet}\n\nShop now! Link in bio 🛒",
                         f"🔥 Why we love {product_name}:\n• Quality you can trust\n• Designed for you\n• Amazing value\n\nWhat are you waiting for? 💫"
                     ]
                 },
@@ -462,19 +644,26 @@ Order now and experience the difference!
         """Execute Quality Validator agent."""
         self.logger.info("🤖 Executing: Quality Validator")
         
-        # Check listing compliance
         compliance_checker = self.tools["compliance_checker"]
-        listing_compliance = compliance_checker.check_listing_compliance(listing)
-        
-        # Check hallucinations
         validation_context = {
             "product_info": context.get("product_info", {}),
             "market_insights": self.memory_manager.retrieve("market_research", "insights", "shared")
         }
         
-        is_valid, hallucination_report = self.hallucination_guard.validate_content(
-            listing, validation_context
-        )
+        # Check listing compliance and hallucinations in parallel
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            compliance_future = executor.submit(compliance_checker.check_listing_compliance, listing)
+            hallucination_future = executor.submit(
+                self.hallucination_guard.validate_content, listing, validation_context
+            )
+            listing_compliance = compliance_future.result()
+            is_valid, hallucination_report = hallucination_future.result()
+        
+        # Collect per-component scores and violations in one pass
+        component_scores, compliance_violations = {}, []
+        for comp, result in listing_compliance.get("component_results", {}).items():
+            component_scores[comp] = result["score"]
+            compliance_violations.extend(result.get("violations", ()))
         
         # Compile validation report
         validation_report = {
@@ -482,14 +671,8 @@ Order now and experience the difference!
             "compliance_check": {
                 "passed": listing_compliance["overall_compliant"],
                 "score": listing_compliance["overall_score"],
-                "component_scores": {
-                    comp: result["score"] 
-                    for comp, result in listing_compliance.get("component_results", {}).items()
-                },
-                "violations": [
-                    v for result in listing_compliance.get("component_results", {}).values()
-                    for v in result.get("violations", [])
-                ]
+                "component_scores": component_scores,
+                "violations": compliance_violations
             },
             "hallucination_check": {
                 "passed": is_valid,
@@ -522,30 +705,53 @@ Order now and experience the difference!
         
     def _save_outputs(self, workflow_id: str, output: Dict[str, Any]):
         """Save campaign outputs to files."""
-        results_dir = Path(__file__).parent / "storage" / "results"
+        results_dir = PROJECT_ROOT / "storage" / "results"
         results_dir.mkdir(parents=True, exist_ok=True)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Save JSON
+        # Reuse the workflow's own timestamp so file names match its ID
+        timestamp = workflow_id.removeprefix("campaign_")
         json_path = results_dir / f"campaign_{timestamp}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2)
-        self.logger.info(f"💾 Saved JSON output: {json_path}")
-        
-        # Save Markdown
         md_path = results_dir / f"campaign_{timestamp}.md"
-        markdown_content = self._generate_markdown_report(output)
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        self.logger.info(f"💾 Saved Markdown output: {md_path}")
         
+        # Only the formats enabled under output.formats in global_config.yaml
+        formats = self.config.get("global", {}).get("output", {}).get("formats", ["json", "markdown"])
+        
+        # Write the JSON while the Markdown report is rendered and written
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            saves = []
+            if "json" in formats:
+                saves.append(("JSON", json_path, executor.submit(self._write_json, json_path, output)))
+            if "markdown" in formats:
+                saves.append(("Markdown", md_path, executor.submit(
+                    self._write_text, md_path, self._generate_markdown_report(output)
+                )))
+            for label, path, future in saves:
+                future.result()
+                self.logger.info(f"💾 Saved {label} output: {path}")
+        
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]):
+        """Write data to a JSON file."""
+        if ORJSON_AVAILABLE:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+            
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+            
+    @staticmethod
+    def _write_text(path: Path, content: str):
+        """Write text content to a file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+            
     def _generate_markdown_report(self, output: Dict[str, Any]) -> str:
         """Generate markdown report from output."""
         product_name = output.get("product_name", "Unknown Product")
         workflow_id = output.get("workflow_id", "N/A")
         
-        md = f"""# Amazon Campaign Report: {product_name}
+        parts = [f"""# Amazon Campaign Report: {product_name}
 
 **Workflow ID:** `{workflow_id}`  
 **Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}  
@@ -555,65 +761,65 @@ Order now and experience the difference!
 ## 📋 Campaign Plan
 
 ### Objectives
-"""
+"""]
         
         for obj in output.get("campaign_plan", {}).get("campaign_objectives", []):
-            md += f"- {obj}\n"
+            parts.append(f"- {obj}\n")
             
-        md += f"""
+        parts.append(f"""
 ### Timeline
 {output.get("campaign_plan", {}).get("timeline", "N/A")}
 
 ### Success Metrics
-"""
+""")
         
         metrics = output.get("campaign_plan", {}).get("success_metrics", {})
         for key, value in metrics.items():
-            md += f"- **{key.replace('_', ' ').title()}:** {value}\n"
+            parts.append(f"- **{key.replace('_', ' ').title()}:** {value}\n")
             
-        md += """
+        parts.append("""
 
 ---
 
 ## 🔍 Market Research Insights
 
 ### Key Trends
-"""
+""")
         
         for trend in output.get("market_insights", {}).get("key_trends", []):
-            md += f"- {trend}\n"
+            parts.append(f"- {trend}\n")
             
-        md += """
+        parts.append("""
 
 ### Competitor Analysis
-"""
+""")
         
         competitors = output.get("market_insights", {}).get("competitor_analysis", {}).get("top_competitors", [])
         for comp in competitors:
-            md += f"- **{comp.get('name')}:** {comp.get('price_range')} | ⭐ {comp.get('rating')} ({comp.get('reviews')} reviews)\n"
+            parts.append(f"- **{comp.get('name')}:** {comp.get('price_range')} | ⭐ {comp.get('rating')} ({comp.get('reviews')} reviews)\n")
             
-        md += """
+        parts.append("""
 
 ---
 
 ## 🔑 SEO Strategy
 
 ### Primary Keywords
-"""
+""")
         
         for kw in output.get("seo_strategy", {}).get("primary_keywords", []):
-            md += f"- {kw}\n"
+            parts.append(f"- {kw}\n")
             
-        md += """
+        parts.append("""
 
 ### Secondary Keywords
-"""
+""")
         
         for kw in output.get("seo_strategy", {}).get("secondary_keywords", [])[:5]:
-            md += f"- {kw}\n"
+            parts.append(f"- {kw}\n")
             
         listing = output.get("amazon_listing", {})
-        md += f"""
+        parts.append(f"""
 
 ---
 
@@ -625,12 +831,12 @@ Order now and experience the difference!
 ```
 
 ### Bullet Points
-"""
+""")
         
         for bullet in listing.get("bullet_points", []):
-            md += f"{bullet}\n\n"
+            parts.append(f"{bullet}\n\n")
             
-        md += f"""
+        parts.append(f"""
 
 ### Product Description
 {listing.get("product_description", "N/A")}
@@ -639,60 +845,60 @@ Order now and experience the difference!
 
 ## 📱 Social Media Campaign
 
-"""
+""")
         
         social = output.get("social_media_campaign", {})
         for platform, details in social.get("platforms", {}).items():
-            md += f"### {platform.title()}\n"
-            md += f"- **Post Frequency:** {details.get('post_frequency', 'N/A')}\n"
+            parts.append(f"### {platform.title()}\n")
+            parts.append(f"- **Post Frequency:** {details.get('post_frequency', 'N/A')}\n")
             if "sample_posts" in details:
-                md += "- **Sample Post:**\n"
-                md += f"  > {details['sample_posts'][0]}\n"
-            md += "\n"
+                parts.append("- **Sample Post:**\n")
+                parts.append(f"  > {details['sample_posts'][0]}\n")
+            parts.append("\n")
             
-        md += """
+        parts.append("""
 
 ---
 
 ## ✅ Validation Report
 
-"""
+""")
         
         validation = output.get("validation_report", {})
-        md += f"**Overall Status:** {validation.get('overall_status', 'N/A')}  \n"
-        md += f"**Quality Score:** {validation.get('quality_score', 0):.1f}/100  \n\n"
+        parts.append(f"**Overall Status:** {validation.get('overall_status', 'N/A')}  \n")
+        parts.append(f"**Quality Score:** {validation.get('quality_score', 0):.1f}/100  \n\n")
         
-        md += "### Recommendations\n"
+        parts.append("### Recommendations\n")
         for rec in validation.get("recommendations", []):
-            md += f"- {rec}\n"
+            parts.append(f"- {rec}\n")
             
-        md += """
+        parts.append("""
 
 ---
 
 ## 📊 Workflow Metrics
 
-"""
+""")
         
         metrics = output.get("workflow_metrics", {})
-        md += f"- **Total Execution Time:** {metrics.get('total_execution_time', 0):.2f}s\n"
-        md += f"- **Agents Executed:** {metrics.get('agents_executed', 0)}\n"
-        md += f"- **Stages Completed:** {metrics.get('stages_completed', 0)}\n"
-        md += f"- **Parallel Executions:** {metrics.get('parallel_executions', 0)}\n"
-        md += f"- **Overall Status:** {'✅ Success' if metrics.get('success', False) else '❌ Failed'}\n"
+        parts.append(f"- **Total Execution Time:** {metrics.get('total_execution_time', 0):.2f}s\n")
+        parts.append(f"- **Agents Executed:** {metrics.get('agents_executed', 0)}\n")
+        parts.append(f"- **Stages Completed:** {metrics.get('stages_completed', 0)}\n")
+        parts.append(f"- **Parallel Executions:** {metrics.get('parallel_executions', 0)}\n")
+        parts.append(f"- **Overall Status:** {'✅ Success' if metrics.get('success', False) else '❌ Failed'}\n")
         
-        md += """
+        parts.append("""
 
 ---
 
 *Generated by Amazon Campaign Multi-Agent System (Google ADK)*
-"""
+""")
         
-        return md
+        return "".join(parts)
 
 
 def create_sample_input() -> Dict[str, Any]:
-    """Create sample product input."""
+    """Create sample product input (a fresh dict on every call)."""
     return {
         "product_info": {
             "product_name": "Premium Wireless Bluetooth Headphones",
@@ -729,42 +935,36 @@ def create_sample_input() -> Dict[str, Any]:
 
 def main():
     """Main execution function."""
-    print("=" * 80)
-    print("🚀 Amazon Campaign Multi-Agent System (Google ADK)")
-    print("=" * 80)
-    print()
+    print(_START_BANNER, file=sys.stderr)
     
     try:
         # Check for API key
         if not os.getenv("GEMINI_API_KEY"):
-            print("⚠️  Warning: GEMINI_API_KEY not set in .env file")
-            print("The system will run in demo mode with simulated agent outputs.\n")
+            print(_API_KEY_HINT, file=sys.stderr)
         
         # Initialize system
-        print("Initializing system...")
+        print("Initializing system...", file=sys.stderr)
         system = AmazonCampaignSystem()
-        print()
+        print(file=sys.stderr)
         
         # Create sample input
-        print("Using sample product input: Premium Wireless Bluetooth Headphones")
+        print("Using sample product input: Premium Wireless Bluetooth Headphones", file=sys.stderr)
         product_input = create_sample_input()
-        print()
+        print(file=sys.stderr)
         
         # Run campaign
         result = system.run_campaign(product_input)
+        system.wait_for_saves()
         
-        print()
-        print("=" * 80)
-        print("✅ Campaign Generation Complete!")
-        print("=" * 80)
+        # Final summary goes to stdout; status chatter above goes to stderr
+        print(_SUCCESS_BANNER)
         print(f"\nQuality Score: {result['validation_report']['quality_score']:.1f}/100")
         print(f"Status: {result['validation_report']['overall_status']}")
         print(f"\nOutputs saved to: ./storage/results/")
         print()
         
     except Exception as e:
-        print(f"\n❌ Error: {str(e)}")
-        import traceback
+        print(f"\n❌ Error: {str(e)}", file=sys.stderr)
         traceback.print_exc()
         return 1
         
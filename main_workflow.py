@@ -5,8 +5,10 @@ This is the main orchestrator that uses the CampaignWorkflow to execute
 the complete Amazon campaign creation process.
 """
 
+import io
 import os
 import sys
+import traceback
 from pathlib import Path
 from typing import Dict, Any
 
@@ -15,8 +17,10 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from shared.logger import Logger
-from shared.memory_manager import MemoryManager
+from shared.memory_manager import get_memory_manager
+from shared.async_writer import get_async_writer
 from workflows.campaign_workflow import CampaignWorkflow
+from workflows.structured_output import social_platform_names
 
 
 def create_sample_product() -> Dict[str, Any]:
@@ -24,7 +28,7 @@ def create_sample_product() -> Dict[str, Any]:
     Create sample product information for demonstration.
     
     Returns:
-        Sample product data
+        Sample product data (a fresh dict on every call)
     """
     return {
         "name": "Premium Stainless Steel Water Bottle",
@@ -85,7 +89,7 @@ def main():
         
         # Initialize memory manager
         logger.info("\nInitializing memory system...")
-        memory_manager = MemoryManager()
+        memory_manager = get_memory_manager()
         
         # Initialize campaign workflow
         logger.info("Initializing campaign workflow...")
@@ -97,74 +101,75 @@ def main():
         # Execute workflow
         logger.info("\nExecuting campaign workflow...\n")
         results = campaign_workflow.execute(product_info)
+        for path, error in get_async_writer().flush():
+            logger.error(f"❌ Output not saved: {path} ({error})")
         
-        # Display results summary
-        logger.info("\n" + "=" * 80)
-        logger.info("CAMPAIGN RESULTS SUMMARY")
-        logger.info("=" * 80)
-        
+        # Display results summary (built once, logged as a single record)
         campaign_data = results.get("campaign_results", {})
         validation = campaign_data.get("validation_report", {})
         outputs = results.get("outputs", {})
         
-        logger.info(f"\n📊 Quality Score: {validation.get('overall_score', 'N/A')}/100")
-        logger.info(f"📈 Status: {validation.get('status', 'Unknown')}")
-        logger.info(f"✅ Approved: {'YES' if validation.get('approval') else 'NO'}")
-        logger.info(f"⏱️  Duration: {results.get('workflow_duration', 0):.2f} seconds")
+        summary = io.StringIO()
+        summary.write("\n" + "=" * 80 + "\n")
+        summary.write("CAMPAIGN RESULTS SUMMARY\n")
+        summary.write("=" * 80 + "\n")
+        
+        summary.write(f"\n📊 Quality Score: {validation.get('overall_score', 'N/A')}/100\n")
+        summary.write(f"📈 Status: {validation.get('status', 'Unknown')}\n")
+        summary.write(f"✅ Approved: {'YES' if validation.get('approval') else 'NO'}\n")
+        summary.write(f"⏱️  Duration: {results.get('workflow_duration', 0):.2f} seconds\n")
         
-        logger.info(f"\n📁 Outputs Generated:")
-        logger.info(f"   JSON: {outputs.get('json', 'N/A')}")
-        logger.info(f"   Markdown: {outputs.get('markdown', 'N/A')}")
+        summary.write(f"\n📁 Outputs Generated:\n")
+        summary.write(f"   JSON: {outputs.get('json', 'N/A')}\n")
+        summary.write(f"   Markdown: {outputs.get('markdown', 'N/A')}\n")
         
         # Display listing summary
         listing = campaign_data.get("amazon_listing", {})
         if listing:
-            logger.info(f"\n📝 Amazon Listing:")
-            logger.info(f"   Title Length: {len(listing.get('title', ''))} chars")
-            logger.info(f"   Bullet Points: {len(listing.get('bullet_points', []))} items")
-            logger.info(f"   Description Length: {len(listing.get('description', ''))} chars")
+            summary.write(f"\n📝 Amazon Listing:\n")
+            summary.write(f"   Title Length: {len(listing.get('title', ''))} chars\n")
+            summary.write(f"   Bullet Points: {len(listing.get('bullet_points', []))} items\n")
+            summary.write(f"   Description Length: {len(listing.get('description', ''))} chars\n")
         
         # Display social campaigns summary
         social = campaign_data.get("social_campaigns", {})
         if social:
-            platforms = [
-                key.replace('_campaign', '').title()
-                for key in social.keys()
-                if key.endswith('_campaign')
-            ]
-            logger.info(f"\n📱 Social Media Platforms: {', '.join(platforms)}")
+            platforms = social_platform_names(social)
+            summary.write(f"\n📱 Social Media Platforms: {', '.join(platforms)}\n")
         
         # Display recommendations if any
         recommendations = validation.get("recommendations", [])
         if recommendations:
-            logger.info(f"\n💡 Recommendations ({len(recommendations)}):")
+            summary.write(f"\n💡 Recommendations ({len(recommendations)}):\n")
             for i, rec in enumerate(recommendations[:5], 1):
-                logger.info(f"   {i}. {rec}")
+                summary.write(f"   {i}. {rec}\n")
             if len(recommendations) > 5:
-                logger.info(f"   ... and {len(recommendations) - 5} more")
+                summary.write(f"   ... and {len(recommendations) - 5} more\n")
         
-        logger.info("\n" + "=" * 80)
+        summary.write("\n" + "=" * 80)
+        logger.info(summary.getvalue())
         
         if validation.get("approval"):
             logger.success("✅ CAMPAIGN APPROVED - READY FOR DEPLOYMENT!")
         else:
             logger.warning("⚠️  CAMPAIGN NEEDS REVISIONS - REVIEW RECOMMENDATIONS")
         
-        logger.info("=" * 80)
-        
         # Next steps
-        logger.info("\n📋 Next Steps:")
+        next_steps = io.StringIO()
+        next_steps.write("=" * 80 + "\n")
+        next_steps.write("\n📋 Next Steps:\n")
         if validation.get("approval"):
-            logger.info("   1. Review the generated outputs in ./storage/results/")
-            logger.info("   2. Deploy Amazon listing with provided content")
-            logger.info("   3. Launch social media campaigns")
-            logger.info("   4. Monitor performance metrics")
+            next_steps.write("   1. Review the generated outputs in ./storage/results/\n")
+            next_steps.write("   2. Deploy Amazon listing with provided content\n")
+            next_steps.write("   3. Launch social media campaigns\n")
+            next_steps.write("   4. Monitor performance metrics\n")
         else:
-            logger.info("   1. Review validation report in outputs")
-            logger.info("   2. Address highlighted issues")
-            logger.info("   3. Re-run workflow with improvements")
+            next_steps.write("   1. Review validation report in outputs\n")
+            next_steps.write("   2. Address highlighted issues\n")
+            next_steps.write("   3. Re-run workflow with improvements\n")
         
-        logger.info("\n✨ Campaign workflow completed successfully!\n")
+        next_steps.write("\n✨ Campaign workflow completed successfully!\n")
+        logger.info(next_steps.getvalue())
         
         return 0
         
@@ -174,7 +179,6 @@ def main():
     
     except Exception as e:
         logger.error(f"\n\n❌ Workflow failed with error: {str(e)}")
-        import traceback
         logger.error(traceback.format_exc())
         return 1
 
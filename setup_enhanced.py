@@ -5,6 +5,9 @@ Creates necessary directories and runs a test workflow
 
 import os
 import sys
+import importlib.util
+import concurrent.futures
+import traceback
 from pathlib import Path
 
 def setup_directories():
@@ -22,10 +25,11 @@ def setup_directories():
     ]
     
     print("Creating directory structure...")
-    for directory in directories:
-        directory.mkdir(parents=True, exist_ok=True)
-        print(f"✓ Created: {directory}")
+    # Leaf directories only; parents=True creates the shared ancestors
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda d: d.mkdir(parents=True, exist_ok=True), directories))
     
+    print("\n".join(f"✓ Created: {directory}" for directory in directories))
     print("\n✅ Directory structure created successfully!\n")
 
 
@@ -42,11 +46,11 @@ def check_dependencies():
     
     missing = []
     
+    # Locate each package without executing its top-level code
     for module, package in required_packages.items():
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print(f"✓ {package} installed")
-        except ImportError:
+        else:
             print(f"✗ {package} missing")
             missing.append(package)
     
@@ -104,8 +108,7 @@ def run_test_workflow():
         
     except Exception as e:
         print(f"\n❌ Test workflow failed: {str(e)}")
-        import traceback
-        print(traceback.format_exc())
+        traceback.print_exc(file=sys.stderr)
         return 1
 
 
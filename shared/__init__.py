@@ -3,15 +3,42 @@ Shared utilities initialization module.
 Exports core infrastructure components for the multi-agent system.
 """
 
-from .memory_manager import MemoryManager
-from .context_manager import ContextManager
-from .logger import setup_logger, get_logger, Logger
-from .monitor import AgentMonitor, WorkflowMonitor
-from .state_tracker import StateTracker
-from .hallucination_guard import HallucinationGuard
+import importlib
+
+
+# Exported names, imported lazily so loading one utility skips the others
+_EXPORT_MODULES = {
+    "MemoryManager": ".memory_manager",
+    "get_memory_manager": ".memory_manager",
+    "ContextManager": ".context_manager",
+    "setup_logger": ".logger",
+    "get_logger": ".logger",
+    "Logger": ".logger",
+    "AgentMonitor": ".monitor",
+    "WorkflowMonitor": ".monitor",
+    "StateTracker": ".state_tracker",
+    "HallucinationGuard": ".hallucination_guard",
+    "AsyncFileWriter": ".async_writer",
+    "get_async_writer": ".async_writer",
+    "SessionManager": ".session_manager",
+    "get_session_manager": ".session_manager",
+    "load_env": ".env",
+    "read_yaml": ".resources",
+    "read_prompts": ".resources",
+}
+
+
+def __getattr__(name):
+    """Import a utility module on first access to one of its exports."""
+    if name in _EXPORT_MODULES:
+        module = importlib.import_module(_EXPORT_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "MemoryManager",
+    "get_memory_manager",
     "ContextManager",
     "setup_logger",
     "get_logger",
@@ -20,4 +47,11 @@ __all__ = [
     "WorkflowMonitor",
     "StateTracker",
     "HallucinationGuard",
+    "AsyncFileWriter",
+    "get_async_writer",
+    "SessionManager",
+    "get_session_manager",
+    "load_env",
+    "read_yaml",
+    "read_prompts",
 ]
@@ -0,0 +1,172 @@
+"""
+Async File Writer for ADK Multi-Agent System
+
+Features:
+- Non-blocking buffered writes for result artifacts
+- Background drain thread with aiofiles when available
+- Explicit flush before the process exits
+
+Critical writes (session manifest, approval markers) stay synchronous at
+their call sites; only artifacts that nothing reads back during the run
+are routed through this writer.
+"""
+
+import asyncio
+import atexit
+import json
+import threading
+from pathlib import Path
+from queue import Queue
+from typing import Any, List, Optional, Tuple, Union
+
+from shared.logger import get_logger
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+# Prefer orjson for serializing queued JSON documents when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class AsyncFileWriter:
+    """
+    Buffered file writer backed by a daemon thread.
+    
+    Payloads are serialized before they are queued: text as given, JSON
+    documents as UTF-8 bytes, so later changes to the caller's data never
+    reach the file. Failed writes are logged and returned by flush() so
+    callers can report them.
+    """
+    
+    def __init__(self):
+        """Initialize writer and start the drain thread."""
+        self.write_queue: Queue = Queue()
+        self.writes_completed = 0
+        self._failures: List[Tuple[Path, str]] = []
+        self._failures_lock = threading.Lock()
+        self.logger = get_logger("AsyncFileWriter")
+        
+        self.worker_thread = threading.Thread(
+            target=self._write_worker,
+            daemon=True,
+            name="AsyncFileWriter"
+        )
+        self.worker_thread.start()
+    
+    def buffered_write(self, path: Path, payload: str):
+        """
+        Queue a text file write (non-blocking).
+        
+        Args:
+            path: Destination file path
+            payload: Full file contents
+        """
+        self.write_queue.put((Path(path), payload))
+    
+    def buffered_write_json(self, path: Path, data: Any):
+        """
+        Queue a JSON document write (non-blocking).
+        
+        Args:
+            path: Destination file path
+            data: JSON-serializable object, serialized before this call returns
+        """
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+        self.write_queue.put((Path(path), payload))
+    
+    def flush(self) -> List[Tuple[Path, str]]:
+        """
+        Block until every queued write has finished.
+        
+        Returns:
+            (path, error) for each write that failed since the last flush
+        """
+        self.write_queue.join()
+        with self._failures_lock:
+            failures, self._failures = self._failures, []
+        return failures
+    
+    def _record_failure(self, path: Path, error: Exception):
+        """Log a failed write and keep it for the next flush()."""
+        self.logger.error(f"Failed to write {path}: {error}")
+        with self._failures_lock:
+            self._failures.append((path, str(error)))
+    
+    def _write_worker(self):
+        """Background worker draining the write queue in batches."""
+        while True:
+            batch = [self.write_queue.get()]
+            while not self.write_queue.empty():
+                batch.append(self.write_queue.get_nowait())
+            
+            try:
+                if AIOFILES_AVAILABLE:
+                    asyncio.run(self._drain(batch))
+                else:
+                    for path, payload in batch:
+                        self._write_file(path, payload)
+            except Exception as e:
+                self.logger.error(f"File writer batch failed: {e}")
+                for path, _ in batch:
+                    with self._failures_lock:
+                        self._failures.append((path, str(e)))
+            finally:
+                for _ in batch:
+                    self.write_queue.task_done()
+    
+    async def _drain(self, batch: List[Tuple[Path, Union[str, bytes]]]):
+        """Write a batch of files concurrently with aiofiles."""
+        await asyncio.gather(*(
+            self._write_file_async(path, payload)
+            for path, payload in batch
+        ))
+    
+    async def _write_file_async(self, path: Path, payload: Union[str, bytes]):
+        """Write one file asynchronously."""
+        try:
+            if isinstance(payload, bytes):
+                async with aiofiles.open(path, 'wb') as f:
+                    await f.write(payload)
+            else:
+                async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+                    await f.write(payload)
+            self.writes_completed += 1
+        except Exception as e:
+            self._record_failure(path, e)
+    
+    def _write_file(self, path: Path, payload: Union[str, bytes]):
+        """Write one file synchronously (used when aiofiles is missing)."""
+        try:
+            if isinstance(payload, bytes):
+                with open(path, 'wb') as f:
+                    f.write(payload)
+            else:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+            self.writes_completed += 1
+        except Exception as e:
+            self._record_failure(path, e)
+
+
+_writer: Optional[AsyncFileWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_async_writer() -> AsyncFileWriter:
+    """Get the process-wide async file writer."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = AsyncFileWriter()
+            atexit.register(_writer.flush)
+        return _writer
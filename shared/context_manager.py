@@ -3,7 +3,7 @@ Context Manager for ADK Multi-Agent System
 Manages context propagation and data flow between agents.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 import json
 
@@ -101,6 +101,24 @@ class ContextManager:
         }
         self.workflow_context["agent_outputs"][agent_id] = output
     
+    def store_agent_outputs(self, entries: List[Tuple[str, str, Any]]):
+        """
+        Store outputs from several agents in one call.
+        
+        Args:
+            entries: List of (agent_id, agent_name, output) tuples
+        """
+        timestamp = datetime.now().isoformat()
+        context_outputs = self.workflow_context["agent_outputs"]
+        
+        for agent_id, agent_name, output in entries:
+            self.agent_outputs[agent_id] = {
+                "agent_name": agent_name,
+                "output": output,
+                "timestamp": timestamp
+            }
+            context_outputs[agent_id] = output
+    
     def get_agent_output(self, agent_id: str) -> Optional[Any]:
         """
         Retrieve output from a specific agent.
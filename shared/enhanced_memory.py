@@ -20,6 +20,7 @@ Industry Best Practices:
 
 import json
 import hashlib
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -73,22 +74,26 @@ class LRUCache:
     def __init__(self, capacity: int = 100):
         self.cache = OrderedDict()
         self.capacity = capacity
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Optional[Any]:
-        if key not in self.cache:
-            return None
-        self.cache.move_to_end(key)
-        return self.cache[key]
+        with self._lock:
+            if key not in self.cache:
+                return None
+            self.cache.move_to_end(key)
+            return self.cache[key]
     
     def put(self, key: str, value: Any):
-        if key in self.cache:
-            self.cache.move_to_end(key)
-        self.cache[key] = value
-        if len(self.cache) > self.capacity:
-            self.cache.popitem(last=False)
+        with self._lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            self.cache[key] = value
+            if len(self.cache) > self.capacity:
+                self.cache.popitem(last=False)
     
     def clear(self):
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
 
 
 class EnhancedMemoryManager:
@@ -145,8 +150,9 @@ class EnhancedMemoryManager:
         if enable_caching:
             self.cache = LRUCache(capacity=cache_size)
         
-        # Load long-term memory index
+        # Load long-term memory index (guarded, agents may store concurrently)
         self.longterm_index = self._load_longterm_index()
+        self._index_lock = threading.Lock()
         
         # Load campaign templates
         self.templates_index = self._load_templates_index()
@@ -320,6 +326,24 @@ class EnhancedMemoryManager:
             print(f"Error retrieving memory: {e}")
             return None
     
+    def retrieve_many(
+        self,
+        requests: List[Tuple[str, str, str]]
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """
+        Retrieve several memory entries in one call.
+        
+        Args:
+            requests: List of (agent_id, key, memory_type) tuples
+        
+        Returns:
+            Dictionary mapping each request tuple to its value (or None)
+        """
+        results = {}
+        for agent_id, key, memory_type in requests:
+            results[(agent_id, key, memory_type)] = self.retrieve(agent_id, key, memory_type)
+        return results
+    
     def _save_session_memory(self, agent_id: str, key: str, entry: MemoryEntry):
         """Save memory to session directory."""
         agent_memory_dir = self.session_memory_dir / agent_id
@@ -339,8 +363,9 @@ class EnhancedMemoryManager:
             pickle.dump(entry, f)
         
         # Update index
-        self.longterm_index[memory_key] = str(memory_file)
-        self._save_longterm_index()
+        with self._index_lock:
+            self.longterm_index[memory_key] = str(memory_file)
+            self._save_longterm_index()
     
     def _load_longterm_memory(self, agent_id: str, key: str) -> Optional[MemoryEntry]:
         """Load from long-term memory storage."""
@@ -0,0 +1,22 @@
+"""
+Environment loading for ADK Multi-Agent System
+Reads the project .env file once per process.
+"""
+
+from functools import cache
+
+from dotenv import load_dotenv
+
+
+@cache
+def load_env() -> bool:
+    """
+    Load .env into os.environ on first call; later calls are no-ops.
+    
+    Variables already set in the environment are left untouched, and
+    processes forked afterwards inherit the loaded values.
+    
+    Returns:
+        True if a .env file was found and loaded
+    """
+    return load_dotenv(override=False)
@@ -5,9 +5,10 @@ Implements multi-layer hallucination detection and mitigation strategies.
 
 from typing import Any, Dict, List, Optional, Tuple
 import re
-import yaml
 from datetime import datetime
 
+from shared.resources import read_yaml
+
 
 class HallucinationGuard:
     """
@@ -28,8 +29,7 @@ class HallucinationGuard:
     def _load_config(self, config_path: str) -> Dict:
         """Load validation configuration."""
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return read_yaml(config_path)
         except Exception as e:
             print(f"Warning: Could not load validator config: {e}")
             return self._get_default_config()
@@ -3,6 +3,7 @@ Logger setup for ADK Multi-Agent System
 Configurable logging with file and console output using loguru.
 """
 
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -40,29 +41,33 @@ def setup_logger(config_path: str = "./config/logging.yaml") -> None:
     
     log_config = config.get("logging", {})
     
-    # Console handler
+    # One timestamp per run so the main and error log files pair up
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    # Console handler (stderr keeps stdout free for program output)
     if log_config.get("handlers", {}).get("console", {}).get("enabled", True):
         console_level = log_config["handlers"]["console"].get("level", "INFO")
         console_format = _get_format_string(log_config, "console")
         
         logger.add(
-            sys.stdout,
+            sys.stderr,
             format=console_format,
             level=console_level,
-            colorize=log_config["handlers"]["console"].get("colorize", True)
+            colorize=log_config["handlers"]["console"].get("colorize", True),
+            backtrace=False,
+            diagnose=False
         )
     
-    # File handler
+    # File handler (enqueued so disk writes run on loguru's worker thread)
     if log_config.get("handlers", {}).get("file", {}).get("enabled", True):
         file_config = log_config["handlers"]["file"]
         log_dir = Path(file_config.get("path", "./storage/logs"))
         log_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate log filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_dir / f"amazon_campaign_{timestamp}.log"
         
-        file_level = file_config.get("level", "DEBUG")
+        file_level = os.getenv("LOG_LEVEL", file_config.get("level", "DEBUG"))
         file_format = _get_format_string(log_config, "file")
         
         # File rotation settings
@@ -75,7 +80,10 @@ def setup_logger(config_path: str = "./config/logging.yaml") -> None:
             level=file_level,
             rotation=max_size,
             retention=rotation_config.get('max_files', 10),
-            compression="zip" if rotation_config.get('compress_old', True) else None
+            compression="zip" if rotation_config.get('compress_old', True) else None,
+            enqueue=True,
+            backtrace=False,
+            diagnose=False
         )
     
     # Error file handler
@@ -84,7 +92,6 @@ def setup_logger(config_path: str = "./config/logging.yaml") -> None:
         error_dir = Path(error_config.get("path", "./storage/logs/errors"))
         error_dir.mkdir(parents=True, exist_ok=True)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         error_file = error_dir / f"errors_{timestamp}.log"
         
         logger.add(
@@ -93,7 +100,10 @@ def setup_logger(config_path: str = "./config/logging.yaml") -> None:
             level="ERROR",
             rotation="10 MB",
             retention=10,
-            compression="zip"
+            compression="zip",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False
         )
     
     _logger_configured = True
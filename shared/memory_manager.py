@@ -7,9 +7,11 @@ import json
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import yaml
 import hashlib
+import threading
+from functools import cache
 
 
 class MemoryManager:
@@ -30,6 +32,9 @@ class MemoryManager:
         self.working_memory: Dict[str, Dict] = {}
         self.shared_memory: Dict[str, Any] = {}
         
+        # Agents run on worker threads; guards long-term updates and the disk write
+        self._long_term_lock = threading.RLock()
+        
         # Load persisted memory
         self._load_persisted_memory()
         
@@ -93,8 +98,9 @@ class MemoryManager:
                 
             elif memory_type == "long_term":
                 memory_key = f"{agent_id}:{key}"
-                self.long_term_memory[memory_key] = memory_entry
-                self._persist_long_term_memory()
+                with self._long_term_lock:
+                    self.long_term_memory[memory_key] = memory_entry
+                    self._persist_long_term_memory()
                 
             elif memory_type == "working":
                 if agent_id not in self.working_memory:
@@ -110,6 +116,53 @@ class MemoryManager:
             print(f"Error storing memory: {e}")
             return False
     
+    def store_many(self, entries: List[Tuple[str, str, Any, str]]) -> bool:
+        """
+        Store several memory entries in one call.
+        
+        Long-term entries are persisted to disk once for the whole batch.
+        
+        Args:
+            entries: List of (agent_id, key, value, memory_type) tuples
+            
+        Returns:
+            Success status
+        """
+        try:
+            timestamp = datetime.now().isoformat()
+            persist_long_term = False
+            
+            for agent_id, key, value, memory_type in entries:
+                memory_entry = {
+                    "value": value,
+                    "timestamp": timestamp,
+                    "agent_id": agent_id,
+                    "type": memory_type
+                }
+                
+                if memory_type == "short_term":
+                    self.short_term_memory.setdefault(agent_id, {})[key] = memory_entry
+                    
+                elif memory_type == "long_term":
+                    with self._long_term_lock:
+                        self.long_term_memory[f"{agent_id}:{key}"] = memory_entry
+                    persist_long_term = True
+                    
+                elif memory_type == "working":
+                    self.working_memory.setdefault(agent_id, {})[key] = memory_entry
+                    
+                elif memory_type == "shared":
+                    self.shared_memory[key] = memory_entry
+                    
+            if persist_long_term:
+                self._persist_long_term_memory()
+                
+            return True
+            
+        except Exception as e:
+            print(f"Error storing memory batch: {e}")
+            return False
+    
     def retrieve(self, agent_id: str, key: str, memory_type: str = "short_term") -> Optional[Any]:
         """
         Retrieve data from agent's memory.
@@ -146,6 +199,21 @@ class MemoryManager:
             print(f"Error retrieving memory: {e}")
             return None
     
+    def retrieve_many(self, requests: List[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], Any]:
+        """
+        Retrieve several memory entries in one call.
+        
+        Args:
+            requests: List of (agent_id, key, memory_type) tuples
+            
+        Returns:
+            Dictionary mapping each request tuple to its value (or None)
+        """
+        results = {}
+        for agent_id, key, memory_type in requests:
+            results[(agent_id, key, memory_type)] = self.retrieve(agent_id, key, memory_type)
+        return results
+    
     def get_agent_context(self, agent_id: str) -> Dict[str, Any]:
         """
         Get complete context for an agent (all memory types).
@@ -211,7 +279,7 @@ class MemoryManager:
         """Persist long-term memory to disk."""
         try:
             long_term_file = self.storage_path / "long_term_memory.json"
-            with open(long_term_file, 'w') as f:
+            with self._long_term_lock, open(long_term_file, 'w') as f:
                 json.dump(self.long_term_memory, f, indent=2)
         except Exception as e:
             print(f"Error persisting memory: {e}")
@@ -281,3 +349,14 @@ class MemoryManager:
             "total_agents": len(set(list(self.short_term_memory.keys()) + 
                                    list(self.working_memory.keys())))
         }
+
+
+@cache
+def _memory_manager_for(config_path: Path) -> MemoryManager:
+    """Create the shared memory manager for a resolved configuration path."""
+    return MemoryManager(str(config_path))
+
+
+def get_memory_manager(config_path: str = "./config/memory_config.yaml") -> MemoryManager:
+    """Get the process-wide memory manager for a configuration file."""
+    return _memory_manager_for(Path(config_path).resolve())
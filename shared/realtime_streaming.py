@@ -61,6 +61,9 @@ class LogStreamer:
         Yields:
             SSE formatted messages
         """
+        # Emit a first event immediately so clients can confirm the stream is live
+        yield self._format_sse("connected", {"timestamp": datetime.now().isoformat()})
+        
         # Determine which log file to stream
         if agent_id:
             log_file = self.logs_dir / f"agent_{agent_id}.jsonl"
@@ -87,7 +90,8 @@ class LogStreamer:
                 if line:
                     # Process line
                     try:
-                        event = json.loads(line.strip())
+                        raw = line.strip()
+                        event = json.loads(raw)
                         
                         # Apply filters
                         if event_type and event.get('event_type') != event_type:
@@ -95,8 +99,8 @@ class LogStreamer:
                         if level and event.get('level') != level:
                             continue
                         
-                        # Send event
-                        yield self._format_sse("log_event", event)
+                        # Send event (the log line is already JSON, so forward it as-is)
+                        yield self._format_sse_payload("log_event", raw)
                         
                         # Update position
                         with self._lock:
@@ -128,7 +132,20 @@ class LogStreamer:
         Returns:
             SSE formatted string
         """
-        return f"event: {event_name}\ndata: {json.dumps(data)}\n\n"
+        return self._format_sse_payload(event_name, json.dumps(data, separators=(',', ':')))
+    
+    def _format_sse_payload(self, event_name: str, payload: str) -> str:
+        """
+        Format an already-serialized JSON payload as Server-Sent Event.
+        
+        Args:
+            event_name: Event name
+            payload: JSON string
+            
+        Returns:
+            SSE formatted string
+        """
+        return f"event: {event_name}\ndata: {payload}\n\n"
     
     def get_recent_logs(
         self,
@@ -0,0 +1,62 @@
+"""
+Resource loading for ADK Multi-Agent System
+Cached readers for YAML configs and prompt templates shared by agents and tools.
+"""
+
+import copy
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+import yaml
+
+
+@lru_cache(maxsize=None)
+def _load_yaml(path: str) -> Dict[str, Any]:
+    """Parse a YAML resource file once per process (shared, never handed out)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+@lru_cache(maxsize=None)
+def _load_prompts(prompts_dir: str) -> Dict[str, str]:
+    """Read a prompt directory once per process (shared, never handed out)."""
+    prompts = {}
+    directory = Path(prompts_dir)
+    
+    if directory.exists():
+        for prompt_file in directory.glob("*.txt"):
+            with open(prompt_file, 'r', encoding='utf-8') as f:
+                prompts[prompt_file.stem] = f.read()
+    
+    return prompts
+
+
+def read_yaml(path: str) -> Dict[str, Any]:
+    """
+    Read a YAML resource file, parsing it only once per process.
+    
+    Each call returns its own deep copy, so callers may modify the result.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed YAML content
+    """
+    return copy.deepcopy(_load_yaml(path))
+
+
+def read_prompts(prompts_dir: str) -> Dict[str, str]:
+    """
+    Read the *.txt prompt templates in a directory, only once per process.
+    
+    Each call returns its own dict, so callers may modify the result.
+    
+    Args:
+        prompts_dir: Directory containing prompt template files
+        
+    Returns:
+        Mapping of template name (file stem) to template text
+    """
+    return dict(_load_prompts(prompts_dir))
@@ -15,9 +15,21 @@ import json
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 import threading
+from functools import cache
+
+
+from shared.logger import get_logger
+
+
+# Seconds between background cleanup passes
+CLEANUP_INTERVAL_SECONDS = 3600
+
+# Running cleanup threads and their stop events, one per sessions directory
+_cleanup_threads: Dict[Path, Tuple[threading.Thread, threading.Event]] = {}
+_cleanup_threads_lock = threading.Lock()
 
 
 @dataclass
@@ -76,9 +88,54 @@ class SessionManager:
         # Thread lock for concurrent access
         self._lock = threading.Lock()
         
-        # Run cleanup on initialization if enabled
+        # Run cleanup in the background (once now, then hourly) if enabled
         if self.auto_cleanup:
-            self.cleanup_old_sessions()
+            self.start_auto_cleanup()
+    
+    def start_auto_cleanup(self) -> bool:
+        """
+        Start the hourly cleanup thread for this storage root.
+        
+        Only one thread runs per sessions directory; managers created later
+        for the same root reuse it.
+        
+        Returns:
+            True if a new thread was started
+        """
+        key = self.sessions_root.resolve()
+        with _cleanup_threads_lock:
+            running = _cleanup_threads.get(key)
+            if running is not None and running[0].is_alive():
+                return False
+            
+            stop_event = threading.Event()
+            thread = threading.Thread(
+                target=self._cleanup_worker,
+                args=(stop_event,),
+                daemon=True,
+                name="SessionCleanup"
+            )
+            _cleanup_threads[key] = (thread, stop_event)
+            thread.start()
+            return True
+    
+    def stop_auto_cleanup(self):
+        """Stop the cleanup thread for this storage root, if one is running."""
+        with _cleanup_threads_lock:
+            running = _cleanup_threads.pop(self.sessions_root.resolve(), None)
+        if running is not None:
+            thread, stop_event = running
+            stop_event.set()
+            thread.join(timeout=5.0)
+    
+    def _cleanup_worker(self, stop_event: threading.Event):
+        """Background worker archiving expired sessions until stopped."""
+        while not stop_event.is_set():
+            try:
+                self.cleanup_old_sessions()
+            except Exception as e:
+                get_logger("SessionManager").error(f"Session cleanup failed: {e}")
+            stop_event.wait(CLEANUP_INTERVAL_SECONDS)
     
     def _load_index(self) -> Dict[str, SessionMetadata]:
         """Load session index from disk."""
@@ -357,3 +414,14 @@ class SessionManager:
             stats["avg_quality_score"] = sum(quality_scores) / len(quality_scores)
         
         return stats
+
+
+@cache
+def _session_manager_for(storage_root: Path) -> SessionManager:
+    """Create the shared session manager for a resolved storage root."""
+    return SessionManager(storage_root=str(storage_root))
+
+
+def get_session_manager(storage_root: str = "./storage") -> SessionManager:
+    """Get the process-wide session manager for a storage root."""
+    return _session_manager_for(Path(storage_root).resolve())
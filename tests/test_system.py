@@ -3,12 +3,14 @@ Unit tests for Amazon Campaign Multi-Agent System
 """
 
 import sys
+import json
 import pytest
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from tools import web_search_tool
 from tools.web_search_tool import WebSearchTool
 from tools.keyword_research_tool import KeywordResearchTool
 from tools.amazon_listing_parser import AmazonListingParser
@@ -20,6 +22,9 @@ from shared.memory_manager import MemoryManager
 from shared.context_manager import ContextManager
 from shared.state_tracker import StateTracker, TaskStatus
 from shared.hallucination_guard import HallucinationGuard
+from shared.async_writer import AsyncFileWriter
+from shared.session_manager import SessionManager
+from shared.resources import read_yaml, read_prompts
 
 
 class TestTools:
@@ -34,6 +39,62 @@ class TestTools:
         assert all("title" in r for r in results)
         assert all("snippet" in r for r in results)
         
+    def test_web_search_backoff(self, tmp_path, monkeypatch):
+        """Test web search backoff after a failed live search."""
+        monkeypatch.setattr(web_search_tool, "BACKOFF_STATE_FILE", tmp_path / "search_backoff.json")
+        monkeypatch.setattr(WebSearchTool, "_backoff_delay", 0.0)
+        monkeypatch.setattr(WebSearchTool, "_next_allowed_ts", 0.0)
+        monkeypatch.setattr(WebSearchTool, "_backoff_loaded", False)
+        
+        tool = WebSearchTool()
+        assert tool._should_wait() is False
+        
+        tool._record_failure()
+        assert tool._should_wait() is True
+        assert 2.0 <= tool._backoff_delay <= 120.0
+        
+        tool._record_success()
+        assert tool._should_wait() is False
+    
+    def test_web_search_client_bounded(self, tmp_path, monkeypatch):
+        """Test repeated thread-pool batches reuse one search client."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        opened = []
+        
+        class FakeDDGS:
+            def __init__(self, timeout=None):
+                self.closed = False
+                opened.append(self)
+            
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *exc_info):
+                self.closed = True
+            
+            def text(self, query, max_results=5):
+                return [{"title": query, "body": "", "href": ""}]
+        
+        monkeypatch.setattr(web_search_tool, "BACKOFF_STATE_FILE", tmp_path / "search_backoff.json")
+        monkeypatch.setattr(web_search_tool, "DDGS_AVAILABLE", True)
+        monkeypatch.setattr(web_search_tool, "DDGS", FakeDDGS, raising=False)
+        monkeypatch.setattr(WebSearchTool, "_next_allowed_ts", 0.0)
+        monkeypatch.setattr(WebSearchTool, "_backoff_loaded", False)
+        monkeypatch.setattr(WebSearchTool, "_client", None)
+        
+        tool = WebSearchTool()
+        for batch in range(3):
+            # A fresh pool per batch, like each campaign's stage 2
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(tool.search, [f"q{batch}-{i}" for i in range(4)]))
+            assert all(r[0]["source"] == "duckduckgo" for r in results)
+        
+        assert len(opened) == 1
+        
+        WebSearchTool.close_client()
+        assert opened[0].closed
+        
     def test_keyword_research_tool(self):
         """Test keyword research tool."""
         tool = KeywordResearchTool()
@@ -111,7 +172,38 @@ class TestSharedUtilities:
         
         retrieved = manager.retrieve(agent_id, key, "short_term")
         assert retrieved == value
+    
+    def test_memory_manager_retrieve_many(self):
+        """Test batched memory retrieval."""
+        manager = MemoryManager()
+        manager.store("agent_a", "key_a", {"a": 1}, "short_term")
+        manager.store("agent_b", "key_b", {"b": 2}, "shared")
+        
+        requests = [
+            ("agent_a", "key_a", "short_term"),
+            ("agent_b", "key_b", "shared"),
+            ("agent_c", "missing", "working")
+        ]
+        results = manager.retrieve_many(requests)
+        
+        assert results[requests[0]] == {"a": 1}
+        assert results[requests[1]] == {"b": 2}
+        assert results[requests[2]] is None
+    
+    def test_memory_manager_store_many(self):
+        """Test batched memory storage."""
+        manager = MemoryManager()
+        success = manager.store_many([
+            ("agent_a", "key_a", {"a": 1}, "short_term"),
+            ("agent_b", "key_b", {"b": 2}, "shared"),
+            ("agent_c", "key_c", {"c": 3}, "working")
+        ])
         
+        assert success is True
+        assert manager.retrieve("agent_a", "key_a", "short_term") == {"a": 1}
+        assert manager.retrieve("agent_b", "key_b", "shared") == {"b": 2}
+        assert manager.retrieve("agent_c", "key_c", "working") == {"c": 3}
+    
     def test_context_manager(self):
         """Test context manager."""
         workflow_config = {"data_flow": {"context_propagation": []}}
@@ -129,6 +221,31 @@ class TestSharedUtilities:
         assert "product_info" in context
         assert context["product_info"]["product_name"] == "Test Product"
         
+    def test_context_manager_store_agent_outputs(self):
+        """Test batched agent output storage."""
+        manager = ContextManager({"data_flow": {"context_propagation": []}})
+        context = manager.initialize_workflow_context({"product_info": {}})
+        
+        manager.store_agent_outputs([
+            ("planner", "Planner", {"plan": 1}),
+            ("writer", "Writer", {"copy": 2})
+        ])
+        
+        assert manager.get_agent_output("planner") == {"plan": 1}
+        assert manager.get_agent_output("writer") == {"copy": 2}
+        assert context["agent_outputs"]["writer"] == {"copy": 2}
+        
+    def test_session_manager_single_cleanup_thread(self, tmp_path):
+        """Test managers for one storage root share a single cleanup thread."""
+        first = SessionManager(storage_root=str(tmp_path))
+        second = SessionManager(storage_root=str(tmp_path), auto_cleanup=False)
+        
+        assert second.start_auto_cleanup() is False
+        
+        first.stop_auto_cleanup()
+        assert second.start_auto_cleanup() is True
+        second.stop_auto_cleanup()
+        
     def test_state_tracker(self):
         """Test state tracker."""
         tracker = StateTracker("test_workflow")
@@ -164,6 +281,69 @@ class TestSharedUtilities:
         assert "score" in report
         assert "violations" in report
         assert "warnings" in report
+    
+    def test_hallucination_guard_repeat_validation(self):
+        """Test repeated validation is unaffected by edits to an earlier report."""
+        guard = HallucinationGuard()
+        content = {"title": "Best in the world earbuds"}
+        context = {"product_info": {"product_name": "Earbuds"}}
+        
+        is_valid, first = guard.validate_content(content, context)
+        first["violations"].append({"type": "caller_note"})
+        
+        is_valid_again, second = guard.validate_content(content, context)
+        
+        assert is_valid_again == is_valid
+        assert second["score"] == first["score"]
+        assert {"type": "caller_note"} not in second["violations"]
+    
+    def test_resource_readers_return_independent_copies(self, tmp_path):
+        """Test modifying one read result does not change the next one."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("agent:\n  tags: [a, b]\n", encoding="utf-8")
+        (tmp_path / "system.txt").write_text("You are helpful.", encoding="utf-8")
+        
+        first = read_yaml(str(config_file))
+        first["agent"]["tags"].append("c")
+        first["extra"] = True
+        assert read_yaml(str(config_file)) == {"agent": {"tags": ["a", "b"]}}
+        
+        prompts = read_prompts(str(tmp_path))
+        prompts["system"] = "changed"
+        assert read_prompts(str(tmp_path)) == {"system": "You are helpful."}
+    
+    def test_async_file_writer(self, tmp_path):
+        """Test buffered writes land on disk after flush."""
+        writer = AsyncFileWriter()
+        output_file = tmp_path / "result.json"
+        
+        writer.buffered_write(output_file, '{"ok": true}')
+        writer.flush()
+        
+        assert output_file.read_text(encoding="utf-8") == '{"ok": true}'
+    
+    def test_async_file_writer_json(self, tmp_path):
+        """Test JSON documents are written as they were when queued."""
+        writer = AsyncFileWriter()
+        output_file = tmp_path / "result.json"
+        data = {"agents": {"planner": [1, 2]}}
+        
+        writer.buffered_write_json(output_file, data)
+        data["agents"]["planner"].append(3)
+        writer.flush()
+        
+        assert json.loads(output_file.read_text(encoding="utf-8")) == {"agents": {"planner": [1, 2]}}
+    
+    def test_async_file_writer_reports_failures(self, tmp_path):
+        """Test failed writes are returned by flush."""
+        writer = AsyncFileWriter()
+        missing_dir_file = tmp_path / "missing" / "result.md"
+        
+        writer.buffered_write(missing_dir_file, "# Report")
+        failures = writer.flush()
+        
+        assert [path for path, _ in failures] == [missing_dir_file]
+        assert writer.flush() == []
 
 
 class TestIntegration:
@@ -204,6 +384,22 @@ class TestIntegration:
         assert validation["valid"] is not None
         assert compliance["compliant"] is not None
 
+    def test_run_campaigns_keeps_every_output(self, tmp_path, monkeypatch):
+        """Test back-to-back campaigns write separate output files."""
+        import main
+
+        system = main.AmazonCampaignSystem()
+        monkeypatch.setattr(main, "PROJECT_ROOT", tmp_path)
+
+        results = system.run_campaigns([main.create_sample_input()] * 2)
+
+        workflow_ids = [result["workflow_id"] for result in results]
+        assert len(set(workflow_ids)) == 2
+        results_dir = tmp_path / "storage" / "results"
+        for workflow_id in workflow_ids:
+            assert (results_dir / f"{workflow_id}.json").exists()
+            assert (results_dir / f"{workflow_id}.md").exists()
+
 
 def run_tests():
     """Run all tests."""
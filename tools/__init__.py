@@ -3,12 +3,27 @@ Tools module initialization.
 Exports all custom and external tools for agent use.
 """
 
-from .web_search_tool import WebSearchTool
-from .keyword_research_tool import KeywordResearchTool
-from .amazon_listing_parser import AmazonListingParser
-from .compliance_checker import ComplianceChecker
-from .calculator_tool import CalculatorTool
-from .file_parser_tool import FileParserTool
+import importlib
+
+
+# Tool classes, imported lazily so loading one tool module skips the others
+_TOOL_MODULES = {
+    "WebSearchTool": ".web_search_tool",
+    "KeywordResearchTool": ".keyword_research_tool",
+    "AmazonListingParser": ".amazon_listing_parser",
+    "ComplianceChecker": ".compliance_checker",
+    "CalculatorTool": ".calculator_tool",
+    "FileParserTool": ".file_parser_tool",
+}
+
+
+def __getattr__(name):
+    """Import a tool module on first access to its class."""
+    if name in _TOOL_MODULES:
+        module = importlib.import_module(_TOOL_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "WebSearchTool",
@@ -3,16 +3,39 @@ Amazon Listing Parser (Custom Tool)
 Parses and analyzes Amazon product listings for optimization.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 import re
 
 
+# Static lookup tables, built once at import
+_PROHIBITED_TITLE_TERMS = ("amazon", "prime", "best seller", "free shipping")
+_ALLOWED_HTML_TAGS = frozenset({'b', 'i', 'u', 'br', 'p', 'ul', 'li', 'ol'})
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'with', 'for', 'to', 'of', 'on', 'at', 'by', 'from'
+})
+
+# ADK tool schema, built once at import and shared by every to_dict() call.
+# Callers must treat it as read-only.
+_TOOL_SCHEMA = {
+    "name": "amazon_listing_parser",
+    "description": "Parse and validate Amazon product listings. Checks compliance with Amazon's guidelines and character limits.",
+    "parameters": {
+        "listing_text": {
+            "type": "string",
+            "description": "Amazon listing text to parse and validate"
+        }
+    }
+}
+
+
 class AmazonListingParser:
     """
     Custom tool for parsing and analyzing Amazon product listings.
     Validates listing format and extracts key components.
     """
     
+    __slots__ = ("character_limits",)
+    
     def __init__(self):
         """Initialize parser."""
         self.character_limits = {
@@ -71,9 +94,9 @@ class AmazonListingParser:
             warnings.append("Title is too short (recommended: 80-200 characters)")
             
         # Check for prohibited content
-        prohibited = ["amazon", "prime", "best seller", "free shipping"]
-        for term in prohibited:
-            if term.lower() in title.lower():
+        title_lower = title.lower()
+        for term in _PROHIBITED_TITLE_TERMS:
+            if term in title_lower:
                 issues.append(f"Prohibited term '{term}' found in title")
                 
         # Check capitalization
@@ -153,10 +176,9 @@ class AmazonListingParser:
         html_tags = re.findall(r'<[^>]+>', description)
         if html_tags:
             # Validate allowed tags
-            allowed_tags = ['b', 'i', 'u', 'br', 'p', 'ul', 'li', 'ol']
             for tag in html_tags:
                 tag_name = re.search(r'</?(\w+)', tag)
-                if tag_name and tag_name.group(1).lower() not in allowed_tags:
+                if tag_name and tag_name.group(1).lower() not in _ALLOWED_HTML_TAGS:
                     warnings.append(f"Potentially unsupported HTML tag: {tag}")
                     
         return {
@@ -181,12 +203,9 @@ class AmazonListingParser:
         # Simple keyword extraction
         text = text.lower()
         
-        # Remove common words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'with', 'for', 'to', 'of', 'on', 'at', 'by', 'from'}
-        
-        # Extract words
+        # Extract words, dropping common stop words
         words = re.findall(r'\b\w+\b', text)
-        keywords = [w for w in words if w not in stop_words and len(w) > 3]
+        keywords = [w for w in words if w not in _STOP_WORDS and len(w) > 3]
         
         # Count frequency
         keyword_freq = {}
@@ -285,14 +304,5 @@ class AmazonListingParser:
         return report
         
     def to_dict(self) -> Dict[str, Any]:
-        """Convert tool to ADK-compatible dictionary format."""
-        return {
-            "name": "amazon_listing_parser",
-            "description": "Parse and validate Amazon product listings. Checks compliance with Amazon's guidelines and character limits.",
-            "parameters": {
-                "listing_text": {
-                    "type": "string",
-                    "description": "Amazon listing text to parse and validate"
-                }
-            }
-        }
+        """Return the shared ADK tool schema (read-only, do not mutate)."""
+        return _TOOL_SCHEMA
@@ -3,17 +3,38 @@ Calculator Tool (Simple Custom Tool)
 Provides basic mathematical calculations for agents.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 import re
 import math
 
 
+# ADK tool schema, built once at import and shared by every to_dict() call.
+# Callers must treat it as read-only.
+_TOOL_SCHEMA = {
+    "name": "calculator",
+    "description": "Perform mathematical calculations including percentages, ROI, margins, and business metrics.",
+    "parameters": {
+        "expression": {
+            "type": "string",
+            "description": "Mathematical expression to evaluate or operation name"
+        },
+        "values": {
+            "type": "object",
+            "description": "Values for specific calculations (optional)",
+            "optional": True
+        }
+    }
+}
+
+
 class CalculatorTool:
     """
     Simple calculator tool for mathematical operations.
     Useful for ROI calculations, pricing, metrics, etc.
     """
     
+    __slots__ = ("calculation_history",)
+    
     def __init__(self):
         """Initialize calculator."""
         self.calculation_history: List[Dict] = []
@@ -182,19 +203,5 @@ class CalculatorTool:
         return (conversions / visitors) * 100
         
     def to_dict(self) -> Dict[str, Any]:
-        """Convert tool to ADK-compatible dictionary format."""
-        return {
-            "name": "calculator",
-            "description": "Perform mathematical calculations including percentages, ROI, margins, and business metrics.",
-            "parameters": {
-                "expression": {
-                    "type": "string",
-                    "description": "Mathematical expression to evaluate or operation name"
-                },
-                "values": {
-                    "type": "object",
-                    "description": "Values for specific calculations (optional)",
-                    "optional": True
-                }
-            }
-        }
+        """Return the shared ADK tool schema (read-only, do not mutate)."""
+        return _TOOL_SCHEMA
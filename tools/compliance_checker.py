@@ -3,9 +3,49 @@ Compliance Checker (Custom Tool)
 Validates content against Amazon TOS and marketplace policies.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Set, Tuple
 import re
-import yaml
+
+from shared.resources import read_yaml
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Amazon character limits per content type
+_CHARACTER_LIMITS = {
+    "title": 200,
+    "bullet_point": 500,
+    "description": 2000,
+    "search_terms": 250
+}
+
+# Trigger-term alternations, compiled once so each check is a single scan
+_COMPETITOR_RE = re.compile(r"vs|versus|compared to|better than")
+_ABSOLUTE_CLAIM_RE = re.compile(r"guaranteed|100%|always|never|best|only")
+_MEDICAL_CLAIM_RE = re.compile(r"cure|heal|treat|medical")
+_VAGUE_CLAIM_RE = re.compile(r"high quality|premium|luxury")
+
+# ADK tool schema, built once at import and shared by every to_dict() call.
+# Callers must treat it as read-only.
+_TOOL_SCHEMA = {
+    "name": "compliance_checker",
+    "description": "Check content for Amazon TOS compliance and marketplace policy violations. Validates against prohibited content, character limits, and brand safety.",
+    "parameters": {
+        "content": {
+            "type": "string",
+            "description": "Content to check for compliance"
+        },
+        "content_type": {
+            "type": "string",
+            "description": "Type of content (title, bullet_points, description)",
+            "optional": True
+        }
+    }
+}
 
 
 class ComplianceChecker:
@@ -13,6 +53,10 @@ class ComplianceChecker:
     Custom compliance checking tool for Amazon marketplace policies.
     """
     
+    __slots__ = (
+        "rules", "violation_history", "_content_rules", "_keyword_rules", "_patterns", "_automaton"
+    )
+    
     def __init__(self, rules_config_path: str = "./config/validator_rules.yaml"):
         """
         Initialize compliance checker.
@@ -22,17 +66,65 @@ class ComplianceChecker:
         """
         self.rules = self._load_rules(rules_config_path)
         self.violation_history: List[Dict] = []
+        self._content_rules = self._flatten_content_rules()
+        self._keyword_rules = self._flatten_keyword_rules()
+        self._patterns = {rule[-1] for rule in self._content_rules + self._keyword_rules}
+        self._automaton = self._build_automaton()
         
     def _load_rules(self, config_path: str) -> Dict:
         """Load compliance rules from configuration."""
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                return config.get("validation", {}).get("amazon_compliance", {})
+            config = read_yaml(config_path)
+            return config.get("validation", {}).get("amazon_compliance", {})
         except Exception as e:
             print(f"Warning: Could not load compliance rules: {e}")
             return self._get_default_rules()
             
+    def _flatten_content_rules(self) -> Tuple[Tuple[str, str, str, str], ...]:
+        """Flatten enabled content-policy rules to (category, severity, pattern, pattern_lower) rows."""
+        content_policy = self.rules.get("content_policy", {})
+        if not content_policy.get("enabled", True):
+            return ()
+            
+        return tuple(
+            (category["category"], category["severity"], pattern, pattern.lower())
+            for category in content_policy.get("prohibited_content", [])
+            for pattern in category.get("patterns", [])
+        )
+        
+    def _flatten_keyword_rules(self) -> Tuple[Tuple[str, str], ...]:
+        """Flatten enabled keyword restrictions to (keyword, keyword_lower) rows."""
+        keyword_restrictions = self.rules.get("keyword_restrictions", {})
+        if not keyword_restrictions.get("enabled", True):
+            return ()
+            
+        return tuple(
+            (keyword, keyword.lower())
+            for keyword in keyword_restrictions.get("prohibited_keywords", [])
+        )
+        
+    def _build_automaton(self):
+        """Build an Aho-Corasick automaton over all rule patterns, if available."""
+        if not AHOCORASICK_AVAILABLE or not self._patterns:
+            return None
+            
+        automaton = ahocorasick.Automaton()
+        for pattern in self._patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return automaton
+        
+    def _find_patterns(self, content_lower: str) -> Set[str]:
+        """
+        Find which rule patterns occur in lowercased content.
+        
+        With pyahocorasick installed this is a single pass over the content
+        regardless of how many patterns the rules define.
+        """
+        if self._automaton is not None:
+            return {pattern for _, pattern in self._automaton.iter(content_lower)}
+        return {pattern for pattern in self._patterns if pattern in content_lower}
+        
     def _get_default_rules(self) -> Dict:
         """Get default compliance rules."""
         return {
@@ -67,14 +159,17 @@ class ComplianceChecker:
             "content_type": content_type
         }
         
+        # Scan once for every prohibited pattern and keyword
+        found = self._find_patterns(content.lower())
+        
         # Check prohibited content
-        self._check_prohibited_content(content, result)
+        self._check_prohibited_content(found, result)
         
         # Check character limits
         self._check_character_limits(content, content_type, result)
         
         # Check prohibited keywords
-        self._check_prohibited_keywords(content, result)
+        self._check_prohibited_keywords(found, result)
         
         # Calculate compliance score
         critical_count = sum(1 for v in result["violations"] if v.get("severity") == "critical")
@@ -95,38 +190,22 @@ class ComplianceChecker:
             
         return result
         
-    def _check_prohibited_content(self, content: str, result: Dict):
-        """Check for prohibited content patterns."""
-        content_policy = self.rules.get("content_policy", {})
-        if not content_policy.get("enabled", True):
-            return
-            
-        prohibited_list = content_policy.get("prohibited_content", [])
-        content_lower = content.lower()
-        
-        for category in prohibited_list:
-            patterns = category.get("patterns", [])
-            for pattern in patterns:
-                if pattern.lower() in content_lower:
-                    result["violations"].append({
-                        "type": category["category"],
-                        "severity": category["severity"],
-                        "pattern": pattern,
-                        "message": f"Prohibited content detected: {pattern}"
-                    })
-                    result["compliant"] = False
+    def _check_prohibited_content(self, found: Set[str], result: Dict):
+        """Report prohibited content patterns among the found patterns."""
+        for category, severity, pattern, pattern_lower in self._content_rules:
+            if pattern_lower in found:
+                result["violations"].append({
+                    "type": category,
+                    "severity": severity,
+                    "pattern": pattern,
+                    "message": f"Prohibited content detected: {pattern}"
+                })
+                result["compliant"] = False
                     
     def _check_character_limits(self, content: str, content_type: str, result: Dict):
         """Check character limits."""
-        limits = {
-            "title": 200,
-            "bullet_point": 500,
-            "description": 2000,
-            "search_terms": 250
-        }
-        
-        if content_type in limits:
-            max_chars = limits[content_type]
+        if content_type in _CHARACTER_LIMITS:
+            max_chars = _CHARACTER_LIMITS[content_type]
             if len(content) > max_chars:
                 result["violations"].append({
                     "type": "character_limit_exceeded",
@@ -135,17 +214,10 @@ class ComplianceChecker:
                 })
                 result["compliant"] = False
                 
-    def _check_prohibited_keywords(self, content: str, result: Dict):
-        """Check for prohibited keywords."""
-        keyword_restrictions = self.rules.get("keyword_restrictions", {})
-        if not keyword_restrictions.get("enabled", True):
-            return
-            
-        prohibited_keywords = keyword_restrictions.get("prohibited_keywords", [])
-        content_lower = content.lower()
-        
-        for keyword in prohibited_keywords:
-            if keyword.lower() in content_lower:
+    def _check_prohibited_keywords(self, found: Set[str], result: Dict):
+        """Report prohibited keywords among the found patterns."""
+        for keyword, keyword_lower in self._keyword_rules:
+            if keyword_lower in found:
                 result["violations"].append({
                     "type": "prohibited_keyword",
                     "severity": "high",
@@ -219,8 +291,7 @@ class ComplianceChecker:
             result["score"] -= 20
             
         # Check for competitor mentions
-        competitor_indicators = ["vs", "versus", "compared to", "better than"]
-        if any(ind in content_lower for ind in competitor_indicators):
+        if _COMPETITOR_RE.search(content_lower):
             result["issues"].append({
                 "type": "competitor_mention",
                 "severity": "medium",
@@ -253,22 +324,21 @@ class ComplianceChecker:
             claim_lower = claim.lower()
             
             # Check for absolute claims
-            absolute_terms = ["guaranteed", "100%", "always", "never", "best", "only"]
-            if any(term in claim_lower for term in absolute_terms):
+            if _ABSOLUTE_CLAIM_RE.search(claim_lower):
                 result["invalid_claims"].append({
                     "claim": claim,
                     "reason": "Contains absolute term without proof"
                 })
                 result["score"] -= 20
             # Check for medical/health claims
-            elif any(term in claim_lower for term in ["cure", "heal", "treat", "medical"]):
+            elif _MEDICAL_CLAIM_RE.search(claim_lower):
                 result["invalid_claims"].append({
                     "claim": claim,
                     "reason": "Contains medical claim"
                 })
                 result["score"] -= 30
             # Check for vague claims
-            elif any(term in claim_lower for term in ["high quality", "premium", "luxury"]) and len(claim.split()) < 5:
+            elif _VAGUE_CLAIM_RE.search(claim_lower) and len(claim.split()) < 5:
                 result["questionable_claims"].append({
                     "claim": claim,
                     "reason": "Vague claim without specifics"
@@ -290,19 +360,5 @@ class ComplianceChecker:
         }
         
     def to_dict(self) -> Dict[str, Any]:
-        """Convert tool to ADK-compatible dictionary format."""
-        return {
-            "name": "compliance_checker",
-            "description": "Check content for Amazon TOS compliance and marketplace policy violations. Validates against prohibited content, character limits, and brand safety.",
-            "parameters": {
-                "content": {
-                    "type": "string",
-                    "description": "Content to check for compliance"
-                },
-                "content_type": {
-                    "type": "string",
-                    "description": "Type of content (title, bullet_points, description)",
-                    "optional": True
-                }
-            }
-        }
+        """Return the shared ADK tool schema (read-only, do not mutate)."""
+        return _TOOL_SCHEMA
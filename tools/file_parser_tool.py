@@ -9,14 +9,43 @@ import csv
 from pathlib import Path
 
 
+# Parser method per file extension, looked up once instead of an if/elif chain
+_PARSERS = {
+    '.json': 'parse_json',
+    '.csv': 'parse_csv',
+    '.txt': 'parse_text',
+    '.md': 'parse_text'
+}
+
+# ADK tool schema, built once at import and shared by every to_dict() call.
+# Callers must treat it as read-only.
+_TOOL_SCHEMA = {
+    "name": "file_parser",
+    "description": "Parse and extract data from files (JSON, CSV, TXT, MD). Can read product data and campaign information from files.",
+    "parameters": {
+        "file_path": {
+            "type": "string",
+            "description": "Path to file to parse"
+        },
+        "operation": {
+            "type": "string",
+            "description": "Operation to perform (parse, extract_product_data, get_info)",
+            "optional": True
+        }
+    }
+}
+
+
 class FileParserTool:
     """
     File parser for reading and extracting data from various formats.
     """
     
+    __slots__ = ("supported_formats", "parse_history")
+    
     def __init__(self):
         """Initialize file parser."""
-        self.supported_formats = ['.json', '.csv', '.txt', '.md']
+        self.supported_formats = list(_PARSERS)
         self.parse_history: List[Dict] = []
         
     def parse_file(self, file_path: str) -> Dict[str, Any]:
@@ -35,19 +64,12 @@ class FileParserTool:
             return {"error": "File not found", "data": None}
             
         extension = path.suffix.lower()
-        
-        try:
-            if extension == '.json':
-                return self.parse_json(file_path)
-            elif extension == '.csv':
-                return self.parse_csv(file_path)
-            elif extension in ['.txt', '.md']:
-                return self.parse_text(file_path)
-            else:
-                return {"error": f"Unsupported format: {extension}", "data": None}
-                
-        except Exception as e:
-            return {"error": str(e), "data": None}
+        parser_name = _PARSERS.get(extension)
+        if parser_name is None:
+            return {"error": f"Unsupported format: {extension}", "data": None}
+            
+        # Each parser catches its own errors and reports them in the result
+        return getattr(self, parser_name)(file_path)
             
     def parse_json(self, file_path: str) -> Dict[str, Any]:
         """
@@ -282,19 +304,5 @@ class FileParserTool:
             return {"error": str(e)}
             
     def to_dict(self) -> Dict[str, Any]:
-        """Convert tool to ADK-compatible dictionary format."""
-        return {
-            "name": "file_parser",
-            "description": "Parse and extract data from files (JSON, CSV, TXT, MD). Can read product data and campaign information from files.",
-            "parameters": {
-                "file_path": {
-                    "type": "string",
-                    "description": "Path to file to parse"
-                },
-                "operation": {
-                    "type": "string",
-                    "description": "Operation to perform (parse, extract_product_data, get_info)",
-                    "optional": True
-                }
-            }
-        }
+        """Return the shared ADK tool schema (read-only, do not mutate)."""
+        return _TOOL_SCHEMA
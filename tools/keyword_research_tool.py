@@ -3,9 +3,73 @@ Keyword Research Tool (Free/Open Source)
 Provides SEO keyword research using free APIs and web scraping.
 """
 
-from typing import Any, Dict, List, Optional
-import re
+from typing import Any, Dict, List, Tuple
 from datetime import datetime
+from functools import lru_cache
+
+
+# Trigger words, built once at import and matched against whole keyword tokens
+_GENERIC_TERMS = frozenset({"best", "top", "cheap", "buy"})
+
+# Keyword intent classes, checked in order; unmatched keywords are navigational
+_KEYWORD_CLASSES = (
+    (frozenset({"what", "how", "why", "where", "when"}), "informational"),
+    (frozenset({"buy", "price", "prices", "cheap", "deal", "deals", "sale"}), "transactional"),
+    (frozenset({"vs", "compare", "best", "top", "review", "reviews"}), "commercial")
+)
+
+# Keyword variation templates, filled with the seed keyword and category
+_VARIATION_TEMPLATES = (
+    "{seed}",
+
+    # Category-based variations
+    "{seed} {category}",
+    "best {seed}",
+    "{seed} for {category}",
+    "top {seed}",
+    "{seed} reviews",
+    "buy {seed}",
+    "{seed} online",
+    "cheap {seed}",
+    "affordable {seed}",
+    "{seed} deals",
+    "{seed} sale",
+    "premium {seed}",
+    "professional {seed}",
+    "{seed} brands",
+    "{seed} comparison",
+
+    # Question-based keywords
+    "what is {seed}",
+    "how to use {seed}",
+    "why buy {seed}",
+    "where to buy {seed}",
+    "when to use {seed}",
+
+    # Long-tail variations
+    "{seed} with high quality",
+    "{seed} that lasts",
+    "{seed} with warranty",
+    "{seed} with free shipping",
+    "{seed} for beginners"
+)
+
+# ADK tool schema, built once at import and shared by every to_dict() call.
+# Callers must treat it as read-only.
+_TOOL_SCHEMA = {
+    "name": "keyword_research",
+    "description": "Research SEO keywords for product optimization. Generates keyword suggestions with search volume and competition estimates.",
+    "parameters": {
+        "seed_keyword": {
+            "type": "string",
+            "description": "Base keyword to research"
+        },
+        "product_category": {
+            "type": "string",
+            "description": "Product category for context"
+        }
+    }
+}
 
 
 class KeywordResearchTool:
@@ -14,6 +78,8 @@ class KeywordResearchTool:
     Uses algorithmic approach and web data for keyword suggestions.
     """
     
+    __slots__ = ("keyword_history",)
+    
     def __init__(self):
         """Initialize keyword research tool."""
         self.keyword_history: List[Dict] = []
@@ -29,22 +95,18 @@ class KeywordResearchTool:
         Returns:
             List of keyword suggestions with metrics
         """
-        keywords = []
-        
-        # Generate variations
-        variations = self._generate_variations(seed_keyword, product_category)
-        
-        for keyword in variations:
-            keywords.append({
+        # Fresh dicts per call so callers can't mutate the cached scores
+        keywords = [
+            {
                 "keyword": keyword,
-                "search_volume": self._estimate_search_volume(keyword),
-                "competition": self._estimate_competition(keyword),
-                "relevance": self._calculate_relevance(keyword, seed_keyword),
-                "keyword_type": self._classify_keyword(keyword)
-            })
-            
-        # Sort by relevance and search volume
-        keywords.sort(key=lambda x: (x["relevance"], x["search_volume"]), reverse=True)
+                "search_volume": search_volume,
+                "competition": competition,
+                "relevance": relevance,
+                "keyword_type": keyword_type
+            }
+            for keyword, search_volume, competition, relevance, keyword_type
+            in self._score_keywords(seed_keyword, product_category)
+        ]
         
         # Log research
         self.keyword_history.append({
@@ -53,72 +115,69 @@ class KeywordResearchTool:
             "keywords_found": len(keywords)
         })
         
-        return keywords[:20]  # Return top 20
+        return keywords
+        
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _score_keywords(seed_keyword: str, product_category: str) -> Tuple[Tuple[str, int, str, float, str], ...]:
+        """
+        Score and rank keyword variations, memoized per (seed, category).
+        
+        The primary, secondary and long-tail lookups all re-run the same
+        seed, so repeated calls skip variation building and scoring.
+        """
+        tool = KeywordResearchTool
+        seed_lower = seed_keyword.lower()
+        
+        scored = []
+        for keyword in tool._generate_variations(seed_keyword, product_category):
+            # Lowercase once; the scoring helpers all expect normalized text
+            keyword_lower = keyword.lower()
+            scored.append((
+                keyword,
+                tool._estimate_search_volume(keyword_lower),
+                tool._estimate_competition(keyword),
+                tool._calculate_relevance(keyword_lower, seed_lower),
+                tool._classify_keyword(keyword_lower)
+            ))
+        
+        # Sort by relevance and search volume
+        scored.sort(key=lambda x: (x[3], x[1]), reverse=True)
+        
+        return tuple(scored[:20])  # Keep top 20
         
-    def _generate_variations(self, seed: str, category: str) -> List[str]:
+    @staticmethod
+    def _generate_variations(seed: str, category: str) -> List[str]:
         """Generate keyword variations."""
-        variations = [seed]
-        
-        # Add category-based variations
-        variations.extend([
-            f"{seed} {category}",
-            f"best {seed}",
-            f"{seed} for {category}",
-            f"top {seed}",
-            f"{seed} reviews",
-            f"buy {seed}",
-            f"{seed} online",
-            f"cheap {seed}",
-            f"affordable {seed}",
-            f"{seed} deals",
-            f"{seed} sale",
-            f"premium {seed}",
-            f"professional {seed}",
-            f"{seed} brands",
-            f"{seed} comparison"
-        ])
-        
-        # Add question-based keywords
-        variations.extend([
-            f"what is {seed}",
-            f"how to use {seed}",
-            f"why buy {seed}",
-            f"where to buy {seed}",
-            f"when to use {seed}"
-        ])
-        
-        # Add long-tail variations
-        variations.extend([
-            f"{seed} with high quality",
-            f"{seed} that lasts",
-            f"{seed} with warranty",
-            f"{seed} with free shipping",
-            f"{seed} for beginners"
-        ])
+        values = {"seed": seed, "category": category}
+        variations = [template.format_map(values) for template in _VARIATION_TEMPLATES]
         
         return list(set(variations))  # Remove duplicates
         
-    def _estimate_search_volume(self, keyword: str) -> int:
-        """Estimate monthly search volume."""
+    @staticmethod
+    def _estimate_search_volume(keyword_lower: str) -> int:
+        """Estimate monthly search volume of a lowercased keyword."""
         # Simple heuristic based on keyword characteristics
         base_volume = 1000
         
+        words = keyword_lower.split()
+        
         # Shorter keywords typically have higher volume
-        length_factor = max(1, 5 - len(keyword.split()))
+        length_factor = max(1, 5 - len(words))
         
-        # Generic terms have higher volume
-        generic_terms = ["best", "top", "cheap", "buy"]
-        generic_boost = 1.5 if any(term in keyword.lower() for term in generic_terms) else 1.0
+        # Generic terms have higher volume (whole words, so "laptop" isn't "top")
+        generic_boost = 1.5 if not _GENERIC_TERMS.isdisjoint(words) else 1.0
         
         # Long-tail keywords have lower volume
-        is_long_tail = len(keyword.split()) > 4
+        is_long_tail = len(words) > 4
         long_tail_penalty = 0.3 if is_long_tail else 1.0
         
         estimated = int(base_volume * length_factor * generic_boost * long_tail_penalty)
         
         return max(100, min(estimated, 100000))  # Clamp between 100 and 100k
         
-    def _estimate_competition(self, keyword: str) -> str:
+    @staticmethod
+    def _estimate_competition(keyword: str) -> str:
         """Estimate keyword competition level."""
         word_count = len(keyword.split())
         
@@ -130,11 +189,9 @@ class KeywordResearchTool:
         else:
             return "low"
             
-    def _calculate_relevance(self, keyword: str, seed: str) -> float:
-        """Calculate relevance score (0-1)."""
-        keyword_lower = keyword.lower()
-        seed_lower = seed.lower()
-        
+    @staticmethod
+    def _calculate_relevance(keyword_lower: str, seed_lower: str) -> float:
+        """Calculate relevance score (0-1) of a lowercased keyword to a lowercased seed."""
         # Exact match = highest relevance
         if seed_lower == keyword_lower:
             return 1.0
@@ -152,18 +209,15 @@ class KeywordResearchTool:
         
         return overlap * 0.6
         
-    def _classify_keyword(self, keyword: str) -> str:
-        """Classify keyword type."""
-        keyword_lower = keyword.lower()
+    @staticmethod
+    def _classify_keyword(keyword_lower: str) -> str:
+        """Classify type of a lowercased keyword."""
+        tokens = frozenset(keyword_lower.split())
         
-        if any(q in keyword_lower for q in ["what", "how", "why", "where", "when"]):
-            return "informational"
-        elif any(t in keyword_lower for t in ["buy", "price", "cheap", "deal", "sale"]):
-            return "transactional"
-        elif any(c in keyword_lower for c in ["vs", "compare", "best", "top", "review"]):
-            return "commercial"
-        else:
-            return "navigational"
+        for terms, keyword_type in _KEYWORD_CLASSES:
+            if not terms.isdisjoint(tokens):
+                return keyword_type
+        return "navigational"
             
     def analyze_keyword_difficulty(self, keyword: str) -> Dict[str, Any]:
         """
@@ -260,19 +314,47 @@ class KeywordResearchTool:
         
         return secondary[:max_count]
         
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert tool to ADK-compatible dictionary format."""
+    def get_keyword_groups(
+        self,
+        seed: str,
+        category: str,
+        primary_count: int = 5,
+        secondary_count: int = 10,
+        min_words: int = 4
+    ) -> Dict[str, List]:
+        """
+        Get primary, secondary and long-tail keywords in a single pass.
+        
+        Args:
+            seed: Seed keyword
+            category: Product category
+            primary_count: Maximum number of primary keywords
+            secondary_count: Maximum number of secondary keywords
+            min_words: Minimum word count for long-tail
+            
+        Returns:
+            Dictionary with all scored keywords plus primary, secondary and long_tail lists
+        """
+        all_keywords = self.generate_keywords(seed, category)
+        primary, secondary, long_tail = [], [], []
+        
+        for kw in all_keywords:
+            keyword = kw["keyword"]
+            relevance = kw["relevance"]
+            if kw["competition"] in ["medium", "low"] and relevance > 0.7:
+                primary.append(keyword)
+            if 0.4 < relevance <= 0.7:
+                secondary.append(keyword)
+            if len(keyword.split()) >= min_words:
+                long_tail.append(keyword)
+                
         return {
-            "name": "keyword_research",
-            "description": "Research SEO keywords for product optimization. Generates keyword suggestions with search volume and competition estimates.",
-            "parameters": {
-                "seed_keyword": {
-                    "type": "string",
-                    "description": "Base keyword to research"
-                },
-                "product_category": {
-                    "type": "string",
-                    "description": "Product category for context"
-                }
-            }
+            "all": all_keywords,
+            "primary": primary[:primary_count],
+            "secondary": secondary[:secondary_count],
+            "long_tail": long_tail
         }
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the shared ADK tool schema (read-only, do not mutate)."""
+        return _TOOL_SCHEMA
@@ -5,15 +5,67 @@ Provides web search capabilities for market research and fact verification.
 
 from typing import Any, Dict, List, Optional
 from datetime import datetime
+from pathlib import Path
+import atexit
+import json
+import random
+import sys
+import threading
 import time
 
 
 try:
     from duckduckgo_search import DDGS
+    from duckduckgo_search.exceptions import RatelimitException
     DDGS_AVAILABLE = True
 except ImportError:
     DDGS_AVAILABLE = False
-    print("Warning: duckduckgo-search not installed. Using mock mode.")
+    print("Warning: duckduckgo-search not installed. Using mock mode.", file=sys.stderr)
+    
+    class RatelimitException(Exception):
+        """Placeholder so rate-limit handling works without duckduckgo-search."""
+
+# Backoff bounds (seconds) for pausing live searches after a rate limit
+BACKOFF_BASE = 2.0
+BACKOFF_CAP = 120.0
+
+# Persisted cooldown so a re-run skips an API that was just rate limited
+# (anchored to the project root, not the working directory)
+BACKOFF_STATE_FILE = Path(__file__).resolve().parent.parent / "storage" / "cache" / "search_backoff.json"
+
+# Mock result row templates; the snippet is the same for every row of a query
+_MOCK_TITLE = "Search Result {idx} for: {query}"
+_MOCK_SNIPPET = (
+    "This is a mock search result snippet for query: {query}. "
+    "In production, this would contain real search data from DuckDuckGo."
+)
+_MOCK_URL = "https://example.com/result{idx}"
+
+# ADK tool schema, built once at import and shared by every to_dict() call.
+# Callers must treat it as read-only.
+_TOOL_SCHEMA = {
+    "name": "web_search",
+    "description": "Search the web for information using DuckDuckGo. Useful for market research, competitor analysis, and fact verification.",
+    "parameters": {
+        "query": {
+            "type": "string",
+            "description": "The search query"
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of results (default: 5)",
+            "optional": True
+        }
+    }
+}
+
+
+def _close_client(client):
+    """Close a DDGS client, mirroring the end of a `with DDGS()` block."""
+    try:
+        client.__exit__(None, None, None)
+    except Exception as e:
+        print(f"Error closing search client: {e}", file=sys.stderr)
 
 
 class WebSearchTool:
@@ -22,6 +74,19 @@ class WebSearchTool:
     No API key required.
     """
     
+    # Fixed instance attributes, no per-instance __dict__
+    __slots__ = ("max_results", "timeout", "search_history")
+    
+    # Decorrelated-jitter backoff state, shared by all instances
+    _backoff_delay = 0.0
+    _next_allowed_ts = 0.0
+    _backoff_loaded = False
+    
+    # One DuckDuckGo client shared by every thread and closed at exit;
+    # _client_lock serializes requests through it and guards its replacement
+    _client: Any = None
+    _client_lock = threading.Lock()
+    
     def __init__(self, max_results: int = 5, timeout: int = 30):
         """
         Initialize web search tool.
@@ -47,11 +112,13 @@ class WebSearchTool:
         """
         results_limit = max_results if max_results else self.max_results
         
-        if not DDGS_AVAILABLE:
+        if not DDGS_AVAILABLE or self._should_wait():
             return self._mock_search(query, results_limit)
         
+        ddgs = None
         try:
-            with DDGS() as ddgs:
+            with WebSearchTool._client_lock:
+                ddgs = self._get_client()
                 results = []
                 search_gen = ddgs.text(query, max_results=results_limit)
                 
@@ -63,6 +130,8 @@ class WebSearchTool:
                         "source": "duckduckgo"
                     })
                     
+            self._record_success()
+            
             # Log search
             self.search_history.append({
                 "query": query,
@@ -72,21 +141,95 @@ class WebSearchTool:
             
             return results
             
+        except RatelimitException as e:
+            print(f"Search rate limited: {e}")
+            self._record_failure()
+            return self._mock_search(query, results_limit)
+            
         except Exception as e:
             print(f"Search error: {e}")
+            self._reset_client(ddgs)
             return self._mock_search(query, results_limit)
             
+    def _get_client(self):
+        """Return the shared DDGS client (caller holds _client_lock)."""
+        if WebSearchTool._client is None:
+            WebSearchTool._client = DDGS(timeout=self.timeout).__enter__()
+        return WebSearchTool._client
+        
+    def _reset_client(self, client):
+        """Close a failed client so the next search reconnects."""
+        if client is None:
+            return
+        with WebSearchTool._client_lock:
+            # Another thread may already have replaced it
+            if WebSearchTool._client is not client:
+                return
+            WebSearchTool._client = None
+        _close_client(client)
+        
+    @classmethod
+    def close_client(cls):
+        """Close the shared DDGS client, if one was opened."""
+        with cls._client_lock:
+            client, cls._client = cls._client, None
+        if client is not None:
+            _close_client(client)
+        
+    def _should_wait(self) -> bool:
+        """Check whether live searches are paused after a recent rate limit."""
+        if not WebSearchTool._backoff_loaded:
+            self._load_backoff_state()
+        return time.time() < WebSearchTool._next_allowed_ts
+        
+    def _record_failure(self):
+        """Pause live searches after a rate limit using decorrelated jitter backoff."""
+        prev_delay = WebSearchTool._backoff_delay or BACKOFF_BASE
+        WebSearchTool._backoff_delay = min(BACKOFF_CAP, random.uniform(BACKOFF_BASE, prev_delay * 3))
+        WebSearchTool._next_allowed_ts = time.time() + WebSearchTool._backoff_delay
+        self._save_backoff_state()
+        
+    def _record_success(self):
+        """Reset backoff after a successful live search."""
+        if WebSearchTool._next_allowed_ts:
+            WebSearchTool._backoff_delay = 0.0
+            WebSearchTool._next_allowed_ts = 0.0
+            self._save_backoff_state()
+        
+    def _load_backoff_state(self):
+        """Restore a cooldown persisted by an earlier run."""
+        WebSearchTool._backoff_loaded = True
+        try:
+            with open(BACKOFF_STATE_FILE, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            WebSearchTool._backoff_delay = float(state.get("delay", 0.0))
+            WebSearchTool._next_allowed_ts = float(state.get("next_allowed_ts", 0.0))
+        except (OSError, ValueError):
+            pass
+        
+    def _save_backoff_state(self):
+        """Persist the current cooldown for later runs."""
+        try:
+            BACKOFF_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(BACKOFF_STATE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "delay": WebSearchTool._backoff_delay,
+                    "next_allowed_ts": WebSearchTool._next_allowed_ts
+                }, f)
+        except OSError as e:
+            print(f"Could not persist search backoff: {e}")
+            
     def _mock_search(self, query: str, max_results: int) -> List[Dict[str, Any]]:
         """Mock search results for testing/fallback."""
+        snippet = _MOCK_SNIPPET.format(query=query)
         return [
             {
-                "title": f"Search Result {i+1} for: {query}",
-                "snippet": f"This is a mock search result snippet for query: {query}. "
-                          f"In production, this would contain real search data from DuckDuckGo.",
-                "url": f"https://example.com/result{i+1}",
+                "title": _MOCK_TITLE.format(idx=i, query=query),
+                "snippet": snippet,
+                "url": _MOCK_URL.format(idx=i),
                 "source": "mock"
             }
-            for i in range(max_results)
+            for i in range(1, max_results + 1)
         ]
         
     def search_news(self, query: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -102,11 +245,13 @@ class WebSearchTool:
         """
         results_limit = max_results if max_results else self.max_results
         
-        if not DDGS_AVAILABLE:
+        if not DDGS_AVAILABLE or self._should_wait():
             return self._mock_search(f"news: {query}", results_limit)
         
+        ddgs = None
         try:
-            with DDGS() as ddgs:
+            with WebSearchTool._client_lock:
+                ddgs = self._get_client()
                 results = []
                 news_gen = ddgs.news(query, max_results=results_limit)
                 
@@ -119,10 +264,17 @@ class WebSearchTool:
                         "source": result.get("source", "unknown")
                     })
                     
+            self._record_success()
             return results
             
+        except RatelimitException as e:
+            print(f"News search rate limited: {e}")
+            self._record_failure()
+            return self._mock_search(f"news: {query}", results_limit)
+            
         except Exception as e:
             print(f"News search error: {e}")
+            self._reset_client(ddgs)
             return self._mock_search(f"news: {query}", results_limit)
             
     def search_products(self, product_name: str, marketplace: str = "amazon") -> List[Dict[str, Any]]:
@@ -198,19 +350,8 @@ class WebSearchTool:
         self.search_history = []
         
     def to_dict(self) -> Dict[str, Any]:
-        """Convert tool to ADK-compatible dictionary format."""
-        return {
-            "name": "web_search",
-            "description": "Search the web for information using DuckDuckGo. Useful for market research, competitor analysis, and fact verification.",
-            "parameters": {
-                "query": {
-                    "type": "string",
-                    "description": "The search query"
-                },
-                "max_results": {
-                    "type": "integer",
-                    "description": "Maximum number of results (default: 5)",
-                    "optional": True
-                }
-            }
-        }
+        """Return the shared ADK tool schema (read-only, do not mutate)."""
+        return _TOOL_SCHEMA
+
+
+atexit.register(WebSearchTool.close_client)
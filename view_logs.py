@@ -79,18 +79,23 @@ class LogViewer:
                 # Show first N lines
                 display_lines = content[:lines]
                 
+            # Render every line first, then write the block once
+            rendered = []
             for line in display_lines:
                 # Colorize based on log level
                 if 'ERROR' in line:
-                    print(f"🔴 {line.strip()}")
+                    marker = "🔴"
                 elif 'WARNING' in line:
-                    print(f"🟡 {line.strip()}")
+                    marker = "🟡"
                 elif 'SUCCESS' in line or '✅' in line:
-                    print(f"🟢 {line.strip()}")
+                    marker = "🟢"
                 elif 'INFO' in line:
-                    print(f"🔵 {line.strip()}")
+                    marker = "🔵"
                 else:
-                    print(f"   {line.strip()}")
+                    marker = "  "
+                rendered.append(f"{marker} {line.strip()}")
+            if rendered:
+                print("\n".join(rendered))
                     
             if len(content) > abs(lines):
                 print(f"\n... ({len(content) - abs(lines)} more lines)")
@@ -6,6 +6,7 @@ This workflow orchestrates the entire campaign creation process through all agen
 
 import os
 import time
+import concurrent.futures
 from typing import Dict, Any, Optional
 from pathlib import Path
 
@@ -33,7 +34,7 @@ class CampaignWorkflow:
     
     Workflow Stages:
     1. Strategic Planning (Lead Planner)
-    2. Research (Market Research + SEO in parallel)
+    2. Research (Market Research + SEO in parallel), run alongside stage 1
     3. Content Creation (Copywriter)
     4. Social Campaigns (Social Media Marketer)
     5. Quality Validation (Quality Validator)
@@ -124,41 +125,13 @@ class CampaignWorkflow:
         workflow_start = time.time()
         
         try:
-            # Stage 1: Strategic Planning
-            self.logger.info("\n[STAGE 1/5] Strategic Planning")
-            stage1_start = time.time()
-            
-            self.state_tracker.update_task_status("strategic_planning", "in_progress")
-            self.event_monitor.log_stage_start("Strategic Planning", 1)
-            
-            analysis = self.lead_planner.analyze_product(product_info)
-            strategic_plan = self.lead_planner.create_strategic_plan(analysis)
-            coordination = self.lead_planner.coordinate_workflow("research")
-            
-            self.state_tracker.update_task_status("strategic_planning", "completed")
-            self.monitor.track_agent_execution(
-                agent_id="lead_planner",
-                duration=time.time() - stage1_start,
-                success=True
-            )
-            self.event_monitor.log_stage_end("Strategic Planning", 1, time.time() - stage1_start)
-            
-            # Stage 2: Parallel Research (Market Research + SEO)
-            self.logger.info("\n[STAGE 2/5] Research Phase (Parallel Execution)")
-            stage2_start = time.time()
-            
-            self.state_tracker.update_task_status("research", "in_progress")
-            self.event_monitor.log_stage_start("Research Phase", 2)
-            
-            research_results = self.parallel_research.execute(product_info)
-            
-            self.state_tracker.update_task_status("research", "completed")
-            self.monitor.track_workflow_stage(
-                stage="research",
-                duration=time.time() - stage2_start,
-                agents_involved=["market_research_analyst", "seo_specialist"]
-            )
-            self.event_monitor.log_stage_end("Research Phase", 2, time.time() - stage2_start)
+            # Stages 1 and 2: research never reads the strategic plan, so the
+            # lead planner runs alongside the two research agents
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                planning_future = executor.submit(self._run_strategic_planning, product_info)
+                research_future = executor.submit(self._run_research, product_info)
+                strategic_plan = planning_future.result()
+                research_results = research_future.result()
             
             # Stage 3: Content Creation
             self.logger.info("\n[STAGE 3/5] Content Creation")
@@ -250,6 +223,48 @@ class CampaignWorkflow:
             self.state_tracker.update_task_status("workflow", "failed")
             raise
     
+    def _run_strategic_planning(self, product_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Stage 1: analyze the product and build the strategic plan."""
+        self.logger.info("\n[STAGE 1/5] Strategic Planning")
+        stage1_start = time.time()
+        
+        self.state_tracker.update_task_status("strategic_planning", "in_progress")
+        self.event_monitor.log_stage_start("Strategic Planning", 1)
+        
+        analysis = self.lead_planner.analyze_product(product_info)
+        strategic_plan = self.lead_planner.create_strategic_plan(analysis)
+        self.lead_planner.coordinate_workflow("research")
+        
+        self.state_tracker.update_task_status("strategic_planning", "completed")
+        self.monitor.track_agent_execution(
+            agent_id="lead_planner",
+            duration=time.time() - stage1_start,
+            success=True
+        )
+        self.event_monitor.log_stage_end("Strategic Planning", 1, time.time() - stage1_start)
+        
+        return strategic_plan
+        
+    def _run_research(self, product_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Stage 2: run market research and SEO in parallel."""
+        self.logger.info("\n[STAGE 2/5] Research Phase (Parallel Execution)")
+        stage2_start = time.time()
+        
+        self.state_tracker.update_task_status("research", "in_progress")
+        self.event_monitor.log_stage_start("Research Phase", 2)
+        
+        research_results = self.parallel_research.execute(product_info)
+        
+        self.state_tracker.update_task_status("research", "completed")
+        self.monitor.track_workflow_stage(
+            stage="research",
+            duration=time.time() - stage2_start,
+            agents_involved=["market_research_analyst", "seo_specialist"]
+        )
+        self.event_monitor.log_stage_end("Research Phase", 2, time.time() - stage2_start)
+        
+        return research_results
+        
     def get_workflow_status(self) -> Dict[str, Any]:
         """Get current workflow status."""
         return {
@@ -11,11 +11,12 @@ Integrates:
 
 import os
 import time
+import concurrent.futures
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 # Import new enhanced components
-from shared.session_manager import SessionManager
+from shared.session_manager import SessionManager, get_session_manager
 from shared.async_logger import AsyncLogger, LogLevel, EventType
 from shared.enhanced_memory import EnhancedMemoryManager
 from shared.realtime_streaming import ProgressTracker, MetricsCollector
@@ -33,6 +34,36 @@ from agents.quality_validator.agent import QualityValidatorAgent
 from workflows.parallel_research_workflow import ParallelResearchWorkflow
 from workflows.structured_output import StructuredOutputGenerator
 
+# Console progress output; set WORKFLOW_VERBOSE=0 to keep stdout quiet
+VERBOSE = os.getenv("WORKFLOW_VERBOSE", "1") == "1"
+
+# Multi-line console blocks, formatted and written in a single call
+_RULE = "=" * 80
+_LEARNING_TEMPLATE = """
+{rule}
+💡 LEARNING FROM PAST CAMPAIGNS
+{rule}
+Found similar campaign: {product_name}
+Quality Score: {quality_score}%
+Similarity: {similarity:.1f}%
+Consider using suggested keywords and structure as reference.
+{rule}
+"""
+_COMPLETION_TEMPLATE = """
+{rule}
+✅ WORKFLOW COMPLETED SUCCESSFULLY
+{rule}
+Session ID: {session_id}
+Duration: {duration:.2f}s
+Quality Score: {score}/100
+Status: {status}
+Approved: {approved}
+
+📁 Results saved to: {results_dir}
+📊 Logs available at: {logs_dir}
+{rule}
+"""
+
 
 class EnhancedCampaignWorkflow:
     """
@@ -62,11 +93,7 @@ class EnhancedCampaignWorkflow:
         self.storage_root = Path(storage_root)
         
         # Initialize session manager
-        self.session_manager = session_manager or SessionManager(
-            storage_root=storage_root,
-            retention_days=7,
-            auto_cleanup=True
-        )
+        self.session_manager = session_manager or get_session_manager(storage_root)
         
         # Session-specific components (initialized per execution)
         self.session_id: Optional[str] = None
@@ -138,20 +165,18 @@ class EnhancedCampaignWorkflow:
                     f"💡 {suggestions['message']}",
                     data=suggestions
                 )
-                print(f"\n{'='*80}")
-                print(f"💡 LEARNING FROM PAST CAMPAIGNS")
-                print(f"{'='*80}")
-                print(f"Found similar campaign: {suggestions['reference_campaign']['product_name']}")
-                print(f"Quality Score: {suggestions['reference_campaign']['quality_score']}%")
-                print(f"Similarity: {suggestions['similarity_score']*100:.1f}%")
-                print(f"Consider using suggested keywords and structure as reference.")
-                print(f"{'='*80}\n")
+                self._echo(_LEARNING_TEMPLATE.format(
+                    rule=_RULE,
+                    product_name=suggestions['reference_campaign']['product_name'],
+                    quality_score=suggestions['reference_campaign']['quality_score'],
+                    similarity=suggestions['similarity_score'] * 100
+                ))
             
             # Initialize all agents with enhanced components
             agents = self._initialize_agents()
             
             # Stage 1: Strategic Planning
-            print(f"\n[STAGE 1/6] Strategic Planning")
+            self._echo(f"\n[STAGE 1/6] Strategic Planning")
             self.progress_tracker.update_stage(0, 0)
             stage_start = time.time()
             
@@ -174,54 +199,34 @@ class EnhancedCampaignWorkflow:
             self.metrics_collector.record_agent_execution("lead_planner", stage_duration)
             self.progress_tracker.update_stage(0, 100)
             
-            # Stage 2: Market Research
-            print(f"\n[STAGE 2/6] Market Research")
-            self.progress_tracker.update_stage(1, 0)
-            stage_start = time.time()
-            
-            event_id = self.logger.agent_started(
-                agent_id="market_research_analyst",
-                agent_name="Market Research Analyst",
-                task="Competitive analysis and market intelligence"
-            )
-            
-            market_analysis = agents['market_researcher'].analyze_market(product_info)
-            
-            stage_duration = (time.time() - stage_start) * 1000
-            self.logger.agent_completed(
-                agent_id="market_research_analyst",
-                agent_name="Market Research Analyst",
-                duration_ms=stage_duration,
-                parent_event_id=event_id
-            )
-            self.metrics_collector.record_agent_execution("market_research_analyst", stage_duration)
-            self.progress_tracker.update_stage(1, 100)
-            
-            # Stage 3: SEO Analysis
-            print(f"\n[STAGE 3/6] SEO Keyword Research")
-            self.progress_tracker.update_stage(2, 0)
-            stage_start = time.time()
-            
-            event_id = self.logger.agent_started(
-                agent_id="seo_specialist",
-                agent_name="SEO Specialist",
-                task="Keyword research and optimization"
-            )
-            
-            keyword_research = agents['seo_specialist'].research_keywords(product_info)
-            
-            stage_duration = (time.time() - stage_start) * 1000
-            self.logger.agent_completed(
-                agent_id="seo_specialist",
-                agent_name="SEO Specialist",
-                duration_ms=stage_duration,
-                parent_event_id=event_id
-            )
-            self.metrics_collector.record_agent_execution("seo_specialist", stage_duration)
-            self.progress_tracker.update_stage(2, 100)
+            # Stages 2-3: Market Research and SEO only need product_info, so run them concurrently
+            self._echo(f"\n[STAGES 2-3/6] Market Research + SEO Keyword Research (parallel)")
+            
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                market_future = executor.submit(
+                    self._run_agent_stage,
+                    1,
+                    "market_research_analyst",
+                    "Market Research Analyst",
+                    "Competitive analysis and market intelligence",
+                    agents['market_researcher'].analyze_market,
+                    product_info
+                )
+                seo_future = executor.submit(
+                    self._run_agent_stage,
+                    2,
+                    "seo_specialist",
+                    "SEO Specialist",
+                    "Keyword research and optimization",
+                    agents['seo_specialist'].research_keywords,
+                    product_info
+                )
+                
+                market_analysis = market_future.result()
+                keyword_research = seo_future.result()
             
             # Stage 4: Content Creation
-            print(f"\n[STAGE 4/6] Content Creation")
+            self._echo(f"\n[STAGE 4/6] Content Creation")
             self.progress_tracker.update_stage(3, 0)
             stage_start = time.time()
             
@@ -244,7 +249,7 @@ class EnhancedCampaignWorkflow:
             self.progress_tracker.update_stage(3, 100)
             
             # Stage 5: Social Media Campaigns
-            print(f"\n[STAGE 5/6] Social Media Campaign Design")
+            self._echo(f"\n[STAGE 5/6] Social Media Campaign Design")
             self.progress_tracker.update_stage(4, 0)
             stage_start = time.time()
             
@@ -267,7 +272,7 @@ class EnhancedCampaignWorkflow:
             self.progress_tracker.update_stage(4, 100)
             
             # Stage 6: Quality Validation
-            print(f"\n[STAGE 6/6] Quality Validation")
+            self._echo(f"\n[STAGE 6/6] Quality Validation")
             self.progress_tracker.update_stage(5, 0)
             stage_start = time.time()
             
@@ -309,7 +314,7 @@ class EnhancedCampaignWorkflow:
                 )
             
             # Generate structured outputs
-            print(f"\n[OUTPUT GENERATION] Creating structured outputs")
+            self._echo(f"\n[OUTPUT GENERATION] Creating structured outputs")
             
             campaign_results = {
                 "session_id": self.session_id,
@@ -359,17 +364,16 @@ class EnhancedCampaignWorkflow:
             )
             
             # Display results
-            print(f"\n{'='*80}")
-            print(f"✅ WORKFLOW COMPLETED SUCCESSFULLY")
-            print(f"{'='*80}")
-            print(f"Session ID: {self.session_id}")
-            print(f"Duration: {workflow_duration:.2f}s")
-            print(f"Quality Score: {validation_report.get('overall_score')}/100")
-            print(f"Status: {validation_report.get('status')}")
-            print(f"Approved: {'YES' if validation_report.get('approval') else 'NO'}")
-            print(f"\n📁 Results saved to: {session_dir / 'results'}")
-            print(f"📊 Logs available at: {session_dir / 'logs'}")
-            print(f"{'='*80}\n")
+            self._echo(_COMPLETION_TEMPLATE.format(
+                rule=_RULE,
+                session_id=self.session_id,
+                duration=workflow_duration,
+                score=validation_report.get('overall_score'),
+                status=validation_report.get('status'),
+                approved='YES' if validation_report.get('approval') else 'NO',
+                results_dir=session_dir / 'results',
+                logs_dir=session_dir / 'logs'
+            ))
             
             # Stop async logger
             self.logger.stop()
@@ -408,6 +412,57 @@ class EnhancedCampaignWorkflow:
             
             raise
     
+    def _run_agent_stage(
+        self,
+        stage_index: int,
+        agent_id: str,
+        agent_name: str,
+        task: str,
+        run,
+        *args
+    ) -> Dict[str, Any]:
+        """
+        Run one agent stage with progress, logging and metrics bookkeeping.
+        
+        Args:
+            stage_index: Index of the stage in the progress tracker
+            agent_id: Agent identifier
+            agent_name: Agent display name
+            task: Task description for the start event
+            run: Agent method to call
+            *args: Arguments for the agent method
+            
+        Returns:
+            Result of the agent method
+        """
+        self.progress_tracker.update_stage(stage_index, 0)
+        stage_start = time.time()
+        
+        event_id = self.logger.agent_started(
+            agent_id=agent_id,
+            agent_name=agent_name,
+            task=task
+        )
+        
+        result = run(*args)
+        
+        stage_duration = (time.time() - stage_start) * 1000
+        self.logger.agent_completed(
+            agent_id=agent_id,
+            agent_name=agent_name,
+            duration_ms=stage_duration,
+            parent_event_id=event_id
+        )
+        self.metrics_collector.record_agent_execution(agent_id, stage_duration)
+        self.progress_tracker.update_stage(stage_index, 100)
+        
+        return result
+    
+    def _echo(self, message: str):
+        """Print workflow progress to the console when verbose output is enabled."""
+        if VERBOSE:
+            print(message)
+    
     def _initialize_agents(self) -> Dict[str, Any]:
         """Initialize all agents with enhanced components."""
         return {
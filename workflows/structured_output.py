@@ -4,14 +4,26 @@ Structured Output Generator - Create JSON and Markdown Reports
 Generates structured campaign outputs in multiple formats.
 """
 
-import json
 import os
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from pathlib import Path
 
 from shared.memory_manager import MemoryManager
 from shared.logger import Logger
+from shared.async_writer import get_async_writer
+
+
+# Social campaign key -> display name; keys outside this map are not platforms
+SOCIAL_PLATFORM_NAMES = {
+    f"{platform}_campaign": platform.replace('_', ' ').title()
+    for platform in ("instagram", "facebook", "tiktok", "twitter", "linkedin", "youtube", "pinterest")
+}
+
+
+def social_platform_names(social: Dict[str, Any]) -> List[str]:
+    """Display names of the platform campaigns present in a social campaign dict."""
+    return [SOCIAL_PLATFORM_NAMES[key] for key in social if key in SOCIAL_PLATFORM_NAMES]
 
 
 class StructuredOutputGenerator:
@@ -28,6 +40,7 @@ class StructuredOutputGenerator:
         self.logger = logger
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.writer = get_async_writer()
     
     def generate_outputs(self, campaign_results: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -56,21 +69,24 @@ class StructuredOutputGenerator:
             "markdown": str(md_path)
         }
     
+    def flush(self) -> List[Tuple[Path, str]]:
+        """Wait for queued output files to be written; returns failed writes."""
+        return self.writer.flush()
+    
     def _generate_json(self, data: Dict[str, Any], output_path: Path):
         """Generate JSON output."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        # Serialized now and written by the writer thread
+        self.writer.buffered_write_json(output_path, data)
         
-        self.logger.info(f"JSON output saved: {output_path}")
+        self.logger.info(f"JSON output queued: {output_path}")
     
     def _generate_markdown(self, data: Dict[str, Any], output_path: Path):
         """Generate Markdown report."""
         md_content = self._format_markdown(data)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        self.writer.buffered_write(output_path, md_content)
         
-        self.logger.info(f"Markdown report saved: {output_path}")
+        self.logger.info(f"Markdown report queued: {output_path}")
     
     def _format_markdown(self, data: Dict[str, Any]) -> str:
         """Format data as Markdown report."""
@@ -181,15 +197,16 @@ class StructuredOutputGenerator:
         objectives = plan.get('objectives', [])
         timeline = plan.get('timeline', {})
         
-        md = f"### Campaign Objectives\n\n"
-        for i, obj in enumerate(objectives, 1):
-            md += f"{i}. {obj}\n"
+        parts = ["### Campaign Objectives\n\n"]
+        parts.extend(f"{i}. {obj}\n" for i, obj in enumerate(objectives, 1))
         
-        md += f"\n### Timeline\n\n"
-        for phase, duration in timeline.items():
-            md += f"- **{phase.replace('_', ' ').title()}:** {duration}\n"
+        parts.append("\n### Timeline\n\n")
+        parts.extend(
+            f"- **{phase.replace('_', ' ').title()}:** {duration}\n"
+            for phase, duration in timeline.items()
+        )
         
-        return md
+        return "".join(parts)
     
     def _format_market_analysis(self, analysis: Dict[str, Any]) -> str:
         """Format market analysis section."""
@@ -215,24 +232,22 @@ class StructuredOutputGenerator:
         
         primary = keywords.get('primary_keywords', [])
         
-        md = "### Primary Keywords\n\n"
+        parts = ["### Primary Keywords\n\n"]
         for kw in primary[:5]:
             if isinstance(kw, dict):
-                md += f"- **{kw.get('keyword')}**: Volume: {kw.get('search_volume', 'N/A')}, "
-                md += f"Competition: {kw.get('competition', 'N/A')}\n"
+                parts.append(
+                    f"- **{kw.get('keyword')}**: Volume: {kw.get('search_volume', 'N/A')}, "
+                    f"Competition: {kw.get('competition', 'N/A')}\n"
+                )
         
-        return md
+        return "".join(parts)
     
     def _format_bullets(self, bullets: list) -> str:
         """Format bullet points."""
         if not bullets:
             return "No bullet points available."
         
-        md = ""
-        for i, bullet in enumerate(bullets, 1):
-            md += f"\n**{i}.** {bullet}\n"
-        
-        return md
+        return "".join(f"\n**{i}.** {bullet}\n" for i, bullet in enumerate(bullets, 1))
     
     def _format_social_campaigns(self, social: Dict[str, Any]) -> str:
         """Format social campaigns section."""
@@ -241,19 +256,18 @@ class StructuredOutputGenerator:
         
         platforms = ['facebook_campaign', 'instagram_campaign', 'tiktok_campaign', 'pinterest_campaign']
         
-        md = ""
+        parts = []
         for platform in platforms:
             if platform in social:
-                platform_name = platform.replace('_campaign', '').title()
-                md += f"\n### {platform_name}\n"
-                md += f"- Campaign strategy defined ✓\n"
+                platform_name = SOCIAL_PLATFORM_NAMES[platform]
+                parts.append(f"\n### {platform_name}\n- Campaign strategy defined ✓\n")
         
         budget = social.get('budget_allocation', {})
         if budget:
-            md += f"\n### Budget Allocation\n"
-            md += f"- **Total Monthly Budget:** {budget.get('total_monthly', 'N/A')}\n"
+            parts.append("\n### Budget Allocation\n")
+            parts.append(f"- **Total Monthly Budget:** {budget.get('total_monthly', 'N/A')}\n")
         
-        return md
+        return "".join(parts)
     
     def _format_validation_details(self, validation: Dict[str, Any]) -> str:
         """Format validation details."""
@@ -264,25 +278,21 @@ class StructuredOutputGenerator:
             'compliance_check': 'Amazon Compliance'
         }
         
-        md = ""
+        parts = []
         for key, name in components.items():
             if key in validation:
                 score = validation[key].get('score', 'N/A')
                 status = validation[key].get('status', 'Unknown')
-                md += f"- **{name}:** {score}/100 ({status})\n"
+                parts.append(f"- **{name}:** {score}/100 ({status})\n")
         
-        return md
+        return "".join(parts)
     
     def _format_recommendations(self, recommendations: list) -> str:
         """Format recommendations."""
         if not recommendations:
             return "No recommendations - all quality standards met!"
         
-        md = ""
-        for i, rec in enumerate(recommendations, 1):
-            md += f"{i}. {rec}\n"
-        
-        return md
+        return "".join(f"{i}. {rec}\n" for i, rec in enumerate(recommendations, 1))
     
     def _format_workflow_metrics(self, metrics: Dict[str, Any]) -> str:
         """Format workflow metrics."""